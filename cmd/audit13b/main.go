@@ -5,6 +5,7 @@ import (
 	"math"
 	"os"
 	"path/filepath"
+	"sort"
 	"strings"
 
 	"mu-bmd-renderer/internal/bmd"
@@ -105,10 +106,7 @@ func main() {
 			isBody := filter.IsBodyMesh(&m)
 
 			// Bone usage
-			boneSet := map[int16]bool{}
-			for _, n := range m.Nodes {
-				boneSet[n] = true
-			}
+			bones := uniqueBones(m.Nodes)
 
 			fmt.Printf("\n  Mesh[%d]:\n", mi)
 			fmt.Printf("    Texture:  %q (stem=%q, ext=%s)\n", m.TexPath, stem, ext)
@@ -118,7 +116,7 @@ func main() {
 			fmt.Printf("    Normals:  %d\n", len(m.Normals))
 			fmt.Printf("    UVs:      %d\n", len(m.UVs))
 			fmt.Printf("    BBox:     %s\n", bboxStr)
-			fmt.Printf("    BoneRefs: %d unique bones %v\n", len(boneSet), sortedKeys(boneSet))
+			fmt.Printf("    BoneRefs: %d unique bones %v\n", len(bones), bones)
 			fmt.Printf("    IsEffect: %v\n", isEffect)
 			fmt.Printf("    IsBody:   %v\n", isBody)
 
@@ -229,16 +227,20 @@ func main() {
 	}
 }
 
-func sortedKeys(m map[int16]bool) []int {
-	var keys []int
-	for k := range m {
-		keys = append(keys, int(k))
+// uniqueBones returns the distinct bone indices in nodes, ascending.
+// It sorts a copy once and drops adjacent duplicates instead of going
+// through a set.
+func uniqueBones(nodes []int16) []int {
+	keys := make([]int, len(nodes))
+	for i, n := range nodes {
+		keys[i] = int(n)
 	}
-	// Simple insertion sort (small sets)
-	for i := 1; i < len(keys); i++ {
-		for j := i; j > 0 && keys[j-1] > keys[j]; j-- {
-			keys[j-1], keys[j] = keys[j], keys[j-1]
+	sort.Ints(keys)
+	out := keys[:0]
+	for _, k := range keys {
+		if len(out) == 0 || k != out[len(out)-1] {
+			out = append(out, k)
 		}
 	}
-	return keys
+	return out
 }
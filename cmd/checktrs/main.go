@@ -1,6 +1,7 @@
 package main
 
 import (
+	"bufio"
 	"fmt"
 	"os"
 	"strconv"
@@ -23,11 +24,14 @@ func main() {
 		fmt.Fprintln(os.Stderr, err)
 		os.Exit(1)
 	}
+	// Collect the report in one buffer and write it out once at the end.
+	w := bufio.NewWriter(os.Stdout)
+	defer w.Flush()
 	for idx := 0; idx <= maxIdx; idx++ {
 		key := [2]int{sec, idx}
 		e, ok := data[key]
 		if !ok {
-			fmt.Printf("%d_%d: NO TRS\n", sec, idx)
+			fmt.Fprintf(w, "%d_%d: NO TRS\n", sec, idx)
 			continue
 		}
 		bStr := "nil"
@@ -38,7 +42,7 @@ func main() {
 		if e.Standardize != nil {
 			sStr = fmt.Sprintf("%v", *e.Standardize)
 		}
-		fmt.Printf("%d_%d: src=%-7s rot=(%.1f,%.1f,%.1f) sc=%.4f bones=%s std=%s DA=%.1f cam=%q\n",
+		fmt.Fprintf(w, "%d_%d: src=%-7s rot=(%.1f,%.1f,%.1f) sc=%.4f bones=%s std=%s DA=%.1f cam=%q\n",
 			sec, idx, e.Source, e.RotX, e.RotY, e.RotZ, e.Scale, bStr, sStr, e.DisplayAngle, e.Camera)
 	}
 }
@@ -10,24 +10,23 @@
 package main
 
 import (
+	"bufio"
+	"bytes"
 	"encoding/binary"
 	"fmt"
 	"os"
 	"sort"
+	"strconv"
 	"strings"
 
+	"mu-bmd-renderer/internal/crypto"
+
 	"golang.org/x/text/encoding/charmap"
 )
 
-var xorKey = [3]byte{0xFC, 0xCF, 0xAB}
-
-func xorDecrypt(data []byte) []byte {
-	out := make([]byte, len(data))
-	for i, b := range data {
-		out[i] = b ^ xorKey[i%3]
-	}
-	return out
-}
+// win1252 decodes item strings from Windows-1252 (MU Online uses Windows
+// encoding). It is created once and reused; decodeitem is single-threaded.
+var win1252 = charmap.Windows1252.NewDecoder()
 
 func readString(data []byte, offset, length int) string {
 	if offset+length > len(data) {
@@ -35,13 +34,22 @@ func readString(data []byte, offset, length int) string {
 	}
 	s := data[offset : offset+length]
 	idx := 0
+	ascii := true
 	for idx < len(s) && s[idx] != 0 {
+		if s[idx] >= 0x80 {
+			ascii = false
+		}
 		idx++
 	}
-	// Decode from Windows-1252 to UTF-8 (MU Online uses Windows encoding)
-	decoded, err := charmap.Windows1252.NewDecoder().Bytes(s[:idx])
+	s = bytes.TrimSpace(s[:idx])
+	// Windows-1252 matches ASCII below 0x80, so most names need no decoding
+	// and are copied into a string exactly once.
+	if ascii {
+		return string(s)
+	}
+	decoded, err := win1252.Bytes(s)
 	if err != nil {
-		return strings.TrimSpace(string(s[:idx]))
+		return string(s)
 	}
 	return strings.TrimSpace(string(decoded))
 }
@@ -118,6 +126,93 @@ func xmlEscape(s string) string {
 	return s
 }
 
+// appendItem appends one <Item> element line for it to buf.
+func appendItem(buf []byte, it *itemRecord) []byte {
+	buf = append(buf, "\t\t<Item"...)
+	buf = appendIntAttr(buf, "Index", it.index)
+	buf = appendStrAttr(buf, "Name", it.name)
+	buf = appendIntAttr(buf, "KindA", it.kindA)
+	buf = appendIntAttr(buf, "KindB", it.kindB)
+	buf = appendIntAttr(buf, "Type", it.typ)
+	buf = appendIntAttr(buf, "Slot", it.slot)
+	buf = appendIntAttr(buf, "TwoHand", it.twoHand)
+	buf = appendIntAttr(buf, "SkillIndex", it.skillIndex)
+	buf = appendIntAttr(buf, "Width", it.width)
+	buf = appendIntAttr(buf, "Height", it.height)
+	buf = appendIntAttr(buf, "DamageMin", it.damageMin)
+	buf = appendIntAttr(buf, "DamageMax", it.damageMax)
+	buf = appendIntAttr(buf, "Defense", it.defense)
+	buf = appendIntAttr(buf, "SuccessfulBlocking", it.successfulBlocking)
+	buf = appendIntAttr(buf, "AttackSpeed", it.attackSpeed)
+	buf = appendIntAttr(buf, "WalkSpeed", it.walkSpeed)
+	buf = appendIntAttr(buf, "Durability", it.durability)
+	buf = appendIntAttr(buf, "MagicDurability", it.magicDurability)
+	buf = appendIntAttr(buf, "MagicPower", it.magicPower)
+	buf = appendIntAttr(buf, "DropLevel", it.dropLevel)
+	buf = appendIntAttr(buf, "CombatPower", it.combatPower)
+	buf = appendIntAttr(buf, "AttackRate", it.attackRate)
+	buf = appendIntAttr(buf, "ReqLevel", it.reqLevel)
+	buf = appendIntAttr(buf, "ReqStrength", it.reqStrength)
+	buf = appendIntAttr(buf, "ReqDexterity", it.reqDexterity)
+	buf = appendIntAttr(buf, "ReqEnergy", it.reqEnergy)
+	buf = appendIntAttr(buf, "ReqVitality", it.reqVitality)
+	buf = appendIntAttr(buf, "ReqCommand", it.reqCommand)
+	buf = appendIntAttr(buf, "Money", it.money)
+	buf = appendIntAttr(buf, "SetAttrib", it.setAttrib)
+	buf = appendIntAttr(buf, "DarkWizard", it.darkWizard)
+	buf = appendIntAttr(buf, "DarkKnight", it.darkKnight)
+	buf = appendIntAttr(buf, "FairyElf", it.fairyElf)
+	buf = appendIntAttr(buf, "MagicGladiator", it.magicGladiator)
+	buf = appendIntAttr(buf, "DarkLord", it.darkLord)
+	buf = appendIntAttr(buf, "Summoner", it.summoner)
+	buf = appendIntAttr(buf, "RageFighter", it.rageFighter)
+	buf = appendIntAttr(buf, "GrowLancer", it.growLancer)
+	buf = appendIntAttr(buf, "RuneWizard", it.runeWizard)
+	buf = appendIntAttr(buf, "Slayer", it.slayer)
+	buf = appendIntAttr(buf, "GunCrusher", it.gunCrusher)
+	buf = appendIntAttr(buf, "LightWizard", it.lightWizard)
+	buf = appendIntAttr(buf, "LemuriaMage", it.lemuriaMage)
+	buf = appendIntAttr(buf, "IllusionKnight", it.illusionKnight)
+	buf = appendIntAttr(buf, "Alchemist", it.alchemist)
+	buf = appendIntAttr(buf, "Crusader", it.crusader)
+	buf = appendIntAttr(buf, "IceRes", it.iceRes)
+	buf = appendIntAttr(buf, "PoisonRes", it.poisonRes)
+	buf = appendIntAttr(buf, "LightRes", it.lightRes)
+	buf = appendIntAttr(buf, "FireRes", it.fireRes)
+	buf = appendIntAttr(buf, "EarthRes", it.earthRes)
+	buf = appendIntAttr(buf, "WindRes", it.windRes)
+	buf = appendIntAttr(buf, "WaterRes", it.waterRes)
+	buf = appendIntAttr(buf, "Dump", it.dump)
+	buf = appendIntAttr(buf, "Transaction", it.transaction)
+	buf = appendIntAttr(buf, "PersonalStore", it.personalStore)
+	buf = appendIntAttr(buf, "StoreWarehouse", it.storeWarehouse)
+	buf = appendIntAttr(buf, "SellToNPC", it.sellToNPC)
+	buf = appendIntAttr(buf, "ExpensiveItem", it.expensiveItem)
+	buf = appendIntAttr(buf, "Repair", it.repair)
+	buf = appendIntAttr(buf, "Overlap", it.overlap)
+	buf = appendIntAttr(buf, "NonValue", it.nonValue)
+	buf = appendIntAttr(buf, "ElementalDefense", it.elementalDefense)
+	buf = appendStrAttr(buf, "ModelPath", it.modelPath)
+	buf = appendStrAttr(buf, "ModelFile", it.modelFile)
+	return append(buf, "></Item>\n"...)
+}
+
+func appendIntAttr(buf []byte, name string, v int) []byte {
+	buf = append(buf, ' ')
+	buf = append(buf, name...)
+	buf = append(buf, '=', '"')
+	buf = strconv.AppendInt(buf, int64(v), 10)
+	return append(buf, '"')
+}
+
+func appendStrAttr(buf []byte, name, v string) []byte {
+	buf = append(buf, ' ')
+	buf = append(buf, name...)
+	buf = append(buf, '=', '"')
+	buf = append(buf, xmlEscape(v)...)
+	return append(buf, '"')
+}
+
 func main() {
 	inputPath := "Data/Local/item.bmd"
 	outputPath := "Data/Xml/ItemList.xml"
@@ -146,13 +241,21 @@ func main() {
 	fmt.Fprintf(os.Stderr, "item.bmd: %d items, %d bytes/item, %d bytes total\n",
 		itemCount, bytesPerItem, len(raw))
 
-	// Group items by section
-	sections := map[int][]itemRecord{}
-	var sectionOrder []int
+	// item.bmd uses the same per-record 3-byte XOR as ItemTRSData.bmd:
+	// decrypt every complete record in one pass, key restarting per record.
+	// raw is not needed afterwards, so the records are decrypted in place
+	// and the file is only held in memory once.
+	n := itemCount
+	if avail := (len(raw) - 8) / bytesPerItem; n > avail {
+		n = avail
+	}
+	body := raw[4 : 4+n*bytesPerItem]
+	crypto.DecryptTRSRecordsInPlace(body, bytesPerItem)
+
+	records := make([]itemRecord, 0, n)
 
-	offset := 4
-	for i := 0; i < itemCount && offset+bytesPerItem <= len(raw)-4; i++ {
-		rec := xorDecrypt(raw[offset : offset+bytesPerItem])
+	for offset := 0; offset < len(body); offset += bytesPerItem {
+		rec := body[offset : offset+bytesPerItem]
 
 		group := u16(rec, 4)
 		id := u16(rec, 6)
@@ -239,101 +342,65 @@ func main() {
 			elementalDefense: u16(rec, 702),
 		}
 
-		if _, ok := sections[group]; !ok {
-			sectionOrder = append(sectionOrder, group)
-		}
-		sections[group] = append(sections[group], item)
-
-		offset += bytesPerItem
+		records = append(records, item)
 	}
 
-	// Sort sections by index
-	sort.Ints(sectionOrder)
+	// Order by section, keeping file order within a section, so each
+	// section is one contiguous run of records.
+	sort.SliceStable(records, func(a, b int) bool {
+		return records[a].section < records[b].section
+	})
 
-	// Write XML in the exact ItemList.xml format
-	var sb strings.Builder
-	sb.WriteString("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n")
-	sb.WriteString("<ItemList>\n")
+	// Stream XML in the exact ItemList.xml format
+	f, err := os.Create(outputPath)
+	if err != nil {
+		fmt.Fprintf(os.Stderr, "Error writing %s: %v\n", outputPath, err)
+		os.Exit(1)
+	}
+	w := bufio.NewWriter(f)
+	w.WriteString("<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n")
+	w.WriteString("<ItemList>\n")
 
+	var line []byte
 	totalItems := 0
-	for _, secIdx := range sectionOrder {
-		items := sections[secIdx]
+	sectionCount := 0
+	for start := 0; start < len(records); {
+		secIdx := records[start].section
+		end := start + 1
+		for end < len(records) && records[end].section == secIdx {
+			end++
+		}
+		items := records[start:end]
+		start = end
+		sectionCount++
+
 		name := sectionNames[secIdx]
 		if name == "" {
 			name = fmt.Sprintf("Section%d", secIdx)
 		}
 
-		sb.WriteString(fmt.Sprintf("\t<Section Index=\"%d\" Name=\"%s\">\n", secIdx, xmlEscape(name)))
+		fmt.Fprintf(w, "\t<Section Index=\"%d\" Name=\"%s\">\n", secIdx, xmlEscape(name))
 
-		for _, it := range items {
+		for k := range items {
 			totalItems++
-			sb.WriteString(fmt.Sprintf(
-				"\t\t<Item Index=\"%d\" Name=\"%s\""+
-					" KindA=\"%d\" KindB=\"%d\" Type=\"%d\""+
-					" Slot=\"%d\" TwoHand=\"%d\" SkillIndex=\"%d\""+
-					" Width=\"%d\" Height=\"%d\""+
-					" DamageMin=\"%d\" DamageMax=\"%d\""+
-					" Defense=\"%d\" SuccessfulBlocking=\"%d\""+
-					" AttackSpeed=\"%d\" WalkSpeed=\"%d\""+
-					" Durability=\"%d\" MagicDurability=\"%d\" MagicPower=\"%d\""+
-					" DropLevel=\"%d\" CombatPower=\"%d\" AttackRate=\"%d\""+
-					" ReqLevel=\"%d\" ReqStrength=\"%d\" ReqDexterity=\"%d\""+
-					" ReqEnergy=\"%d\" ReqVitality=\"%d\" ReqCommand=\"%d\""+
-					" Money=\"%d\" SetAttrib=\"%d\""+
-					" DarkWizard=\"%d\" DarkKnight=\"%d\" FairyElf=\"%d\""+
-					" MagicGladiator=\"%d\" DarkLord=\"%d\" Summoner=\"%d\""+
-					" RageFighter=\"%d\" GrowLancer=\"%d\" RuneWizard=\"%d\""+
-					" Slayer=\"%d\" GunCrusher=\"%d\" LightWizard=\"%d\""+
-					" LemuriaMage=\"%d\" IllusionKnight=\"%d\""+
-					" Alchemist=\"%d\" Crusader=\"%d\""+
-					" IceRes=\"%d\" PoisonRes=\"%d\" LightRes=\"%d\""+
-					" FireRes=\"%d\" EarthRes=\"%d\" WindRes=\"%d\" WaterRes=\"%d\""+
-					" Dump=\"%d\" Transaction=\"%d\" PersonalStore=\"%d\""+
-					" StoreWarehouse=\"%d\" SellToNPC=\"%d\""+
-					" ExpensiveItem=\"%d\" Repair=\"%d\""+
-					" Overlap=\"%d\" NonValue=\"%d\""+
-					" ElementalDefense=\"%d\""+
-					" ModelPath=\"%s\" ModelFile=\"%s\""+
-					"></Item>\n",
-				it.index, xmlEscape(it.name),
-				it.kindA, it.kindB, it.typ,
-				it.slot, it.twoHand, it.skillIndex,
-				it.width, it.height,
-				it.damageMin, it.damageMax,
-				it.defense, it.successfulBlocking,
-				it.attackSpeed, it.walkSpeed,
-				it.durability, it.magicDurability, it.magicPower,
-				it.dropLevel, it.combatPower, it.attackRate,
-				it.reqLevel, it.reqStrength, it.reqDexterity,
-				it.reqEnergy, it.reqVitality, it.reqCommand,
-				it.money, it.setAttrib,
-				it.darkWizard, it.darkKnight, it.fairyElf,
-				it.magicGladiator, it.darkLord, it.summoner,
-				it.rageFighter, it.growLancer, it.runeWizard,
-				it.slayer, it.gunCrusher, it.lightWizard,
-				it.lemuriaMage, it.illusionKnight,
-				it.alchemist, it.crusader,
-				it.iceRes, it.poisonRes, it.lightRes,
-				it.fireRes, it.earthRes, it.windRes, it.waterRes,
-				it.dump, it.transaction, it.personalStore,
-				it.storeWarehouse, it.sellToNPC,
-				it.expensiveItem, it.repair,
-				it.overlap, it.nonValue,
-				it.elementalDefense,
-				xmlEscape(it.modelPath), xmlEscape(it.modelFile),
-			))
+			line = appendItem(line[:0], &items[k])
+			w.Write(line)
 		}
 
-		sb.WriteString("\t</Section>\n")
+		w.WriteString("\t</Section>\n")
 	}
 
-	sb.WriteString("</ItemList>\n")
+	w.WriteString("</ItemList>\n")
 
-	if err := os.WriteFile(outputPath, []byte(sb.String()), 0644); err != nil {
+	err = w.Flush()
+	if cerr := f.Close(); err == nil {
+		err = cerr
+	}
+	if err != nil {
 		fmt.Fprintf(os.Stderr, "Error writing %s: %v\n", outputPath, err)
 		os.Exit(1)
 	}
 
 	fmt.Fprintf(os.Stderr, "Decoded %d items in %d sections → %s\n",
-		totalItems, len(sectionOrder), outputPath)
+		totalItems, sectionCount, outputPath)
 }
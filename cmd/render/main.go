@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"path/filepath"
+	"runtime/pprof"
 	"time"
 
 	"mu-bmd-renderer/internal/batch"
@@ -24,6 +25,7 @@ func main() {
 	dataDir := flag.String("data", "", "Path to base directory (default: auto-detect)")
 	outputDir := flag.String("output", "", "Output directory (default: Data/Item-renders)")
 	quality := flag.Int("quality", 0, "WebP quality 1-100 (default: 90)")
+	cpuProfile := flag.String("cpuprofile", "", "Write a CPU profile of the render to this file (usable as default.pgo)")
 
 	flag.Parse()
 
@@ -60,15 +62,12 @@ func main() {
 
 	// Filter by section/index
 	if *section >= 0 {
-		var filtered []itemlist.ItemDef
+		// Compact matches in place: one pass, no second slice.
+		filtered := items[:0]
 		for _, it := range items {
-			if it.Section != *section {
-				continue
+			if it.Section == *section && (*index < 0 || it.Index == *index) {
+				filtered = append(filtered, it)
 			}
-			if *index >= 0 && it.Index != *index {
-				continue
-			}
-			filtered = append(filtered, it)
 		}
 		items = filtered
 	}
@@ -83,6 +82,15 @@ func main() {
 		os.Exit(0)
 	}
 
+	// Build the texture index (also scanning Data/Skill for textures used by
+	// some items) in the background: the directory walk is independent of
+	// the TRS files and overlaps with loading them.
+	skillDir := filepath.Join(filepath.Dir(cfg.ItemDir), "Skill")
+	indexDone := make(chan *texture.Index, 1)
+	go func() {
+		indexDone <- texture.BuildIndex(cfg.ItemDir, skillDir)
+	}()
+
 	// Load TRS data
 	trsData, err := trs.Load(cfg.TRSBMD, cfg.CustomTRS, cfg.ItemListXML)
 	if err != nil {
@@ -90,9 +98,7 @@ func main() {
 	}
 	fmt.Printf("TRS data: %d items loaded\n", len(trsData))
 
-	// Build texture index (also scan Data/Skill for textures used by some items)
-	skillDir := filepath.Join(filepath.Dir(cfg.ItemDir), "Skill")
-	texIndex := texture.BuildIndex(cfg.ItemDir, skillDir)
+	texIndex := <-indexDone
 	texCache := texture.NewCache(texIndex)
 	fmt.Printf("Textures: %d indexed\n", texIndex.Len())
 
@@ -124,8 +130,31 @@ func main() {
 		Workers:     cfg.Workers,
 	}
 
+	// Profile the batch only, so the profile reflects the render hot path
+	// and can be used directly for profile-guided builds.
+	var profFile *os.File
+	if *cpuProfile != "" {
+		profFile, err = os.Create(*cpuProfile)
+		if err != nil {
+			fmt.Fprintf(os.Stderr, "Error creating CPU profile: %v\n", err)
+			os.Exit(1)
+		}
+		if err := pprof.StartCPUProfile(profFile); err != nil {
+			fmt.Fprintf(os.Stderr, "Error starting CPU profile: %v\n", err)
+			os.Exit(1)
+		}
+	}
+
 	results := batch.Run(batchCfg, items)
 
+	if profFile != nil {
+		pprof.StopCPUProfile()
+		if err := profFile.Close(); err != nil {
+			fmt.Fprintf(os.Stderr, "Error writing CPU profile: %v\n", err)
+			os.Exit(1)
+		}
+	}
+
 	elapsed := time.Since(start)
 	fmt.Println("------------------------------------------------------------")
 	fmt.Printf("Done in %.1fs\n", elapsed.Seconds())
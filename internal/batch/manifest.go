@@ -1,6 +1,7 @@
 package batch
 
 import (
+	"bufio"
 	"encoding/json"
 	"fmt"
 	"os"
@@ -19,22 +20,53 @@ type ManifestEntry struct {
 }
 
 // WriteManifest writes manifest.json to the output directory.
+// Entries are encoded and written one at a time, so the whole indented
+// document is never held in memory; the output matches json.MarshalIndent
+// with two-space indentation.
 func WriteManifest(path string, items []itemlist.ItemDef) error {
-	entries := make([]ManifestEntry, len(items))
+	f, err := os.Create(path)
+	if err != nil {
+		return err
+	}
+	w := bufio.NewWriter(f)
+
+	err = writeManifestEntries(w, items)
+	if ferr := w.Flush(); err == nil {
+		err = ferr
+	}
+	if cerr := f.Close(); err == nil {
+		err = cerr
+	}
+	return err
+}
+
+func writeManifestEntries(w *bufio.Writer, items []itemlist.ItemDef) error {
+	if len(items) == 0 {
+		_, err := w.WriteString("[]")
+		return err
+	}
+
+	w.WriteString("[\n")
 	for i, it := range items {
-		entries[i] = ManifestEntry{
+		data, err := json.MarshalIndent(ManifestEntry{
 			Section:     it.Section,
 			SectionName: it.SectionName,
 			Index:       it.Index,
 			Name:        it.Name,
 			ModelFile:   it.ModelFile,
 			Image:       fmt.Sprintf("%d/%d.webp", it.Section, it.Index),
+		}, "  ", "  ")
+		if err != nil {
+			return err
+		}
+		w.WriteString("  ")
+		w.Write(data)
+		if i < len(items)-1 {
+			w.WriteString(",\n")
+		} else {
+			w.WriteString("\n")
 		}
 	}
-
-	data, err := json.MarshalIndent(entries, "", "  ")
-	if err != nil {
-		return err
-	}
-	return os.WriteFile(path, data, 0644)
+	_, err := w.WriteString("]")
+	return err
 }
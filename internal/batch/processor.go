@@ -1,6 +1,7 @@
 package batch
 
 import (
+	"bytes"
 	"fmt"
 	"os"
 	"path/filepath"
@@ -197,23 +198,25 @@ func processItem(cfg Config, item itemlist.ItemDef) Result {
 		}
 	}
 
-	f, err := os.Create(outPath)
-	if err != nil {
+	// Encode into memory and write the file in one call: the encoder's many
+	// small writes never reach the OS, and a failed encode leaves no
+	// partial file behind.
+	var buf bytes.Buffer
+	if err := nativewebp.Encode(&buf, img, nil); err != nil {
 		return Result{
 			Name:    item.Name,
 			Section: item.Section,
 			Index:   item.Index,
-			Error:   err.Error(),
+			Error:   fmt.Sprintf("WebP encode: %v", err),
 		}
 	}
-	defer f.Close()
 
-	if err := nativewebp.Encode(f, img, nil); err != nil {
+	if err := os.WriteFile(outPath, buf.Bytes(), 0644); err != nil {
 		return Result{
 			Name:    item.Name,
 			Section: item.Section,
 			Index:   item.Index,
-			Error:   fmt.Sprintf("WebP encode: %v", err),
+			Error:   err.Error(),
 		}
 	}
 
@@ -26,33 +26,26 @@ func Parse(filepath string) ([]Mesh, []Bone, error) {
 	var data []byte
 
 	switch version {
-	case 15:
+	case 12, 14, 15:
+		// Encrypted versions share an 8-byte header: "BMD" + version + u32 size.
 		if len(raw) < 8 {
-			return nil, nil, fmt.Errorf("bmd: truncated v15 header in %s", filepath)
+			return nil, nil, fmt.Errorf("bmd: truncated v%d header in %s", version, filepath)
 		}
+		// Compare in uint64: a size of 2^31 or more would be negative as an
+		// int on 32-bit targets and slip past the check.
 		size := binary.LittleEndian.Uint32(raw[4:8])
-		if 8+int(size) > len(raw) {
-			return nil, nil, fmt.Errorf("bmd: truncated v15 data in %s", filepath)
+		if uint64(size) > uint64(len(raw)-8) {
+			return nil, nil, fmt.Errorf("bmd: truncated v%d data in %s", version, filepath)
 		}
-		data = crypto.DecryptLEA(raw[8:8+size], crypto.LEAKey)
-	case 14:
-		if len(raw) < 8 {
-			return nil, nil, fmt.Errorf("bmd: truncated v14 header in %s", filepath)
-		}
-		size := binary.LittleEndian.Uint32(raw[4:8])
-		if 8+int(size) > len(raw) {
-			return nil, nil, fmt.Errorf("bmd: truncated v14 data in %s", filepath)
-		}
-		data = crypto.DecryptModulus(raw[8 : 8+size])
-	case 12:
-		if len(raw) < 8 {
-			return nil, nil, fmt.Errorf("bmd: truncated v12 header in %s", filepath)
-		}
-		size := binary.LittleEndian.Uint32(raw[4:8])
-		if 8+int(size) > len(raw) {
-			return nil, nil, fmt.Errorf("bmd: truncated v12 data in %s", filepath)
+		enc := raw[8 : 8+int(size)]
+		switch version {
+		case 15:
+			data = crypto.DecryptLEA(enc, crypto.LEAKey)
+		case 14:
+			data = crypto.DecryptModulus(enc)
+		default:
+			data = crypto.DecryptXOR(enc)
 		}
-		data = crypto.DecryptXOR(raw[8 : 8+size])
 	default:
 		data = raw[4:]
 	}
@@ -102,13 +95,43 @@ func (r *reader) readU16() uint16 {
 	return v
 }
 
-func (r *reader) readF32() float32 {
-	if r.off+4 > len(r.data) {
+// block returns the next n bytes and advances past them. If fewer than n
+// remain it returns the rest and moves to the end, so callers decoding
+// fixed-size records leave any records past the end zeroed.
+func (r *reader) block(n int) []byte {
+	if n < 0 || r.off+n > len(r.data) {
+		var b []byte
+		if r.off < len(r.data) {
+			b = r.data[r.off:]
+		}
 		r.off = len(r.data)
+		return b
+	}
+	b := r.data[r.off : r.off+n]
+	r.off += n
+	return b
+}
+
+// f32le decodes a little-endian float32 from the first 4 bytes of b.
+func f32le(b []byte) float32 {
+	return math.Float32frombits(binary.LittleEndian.Uint32(b))
+}
+
+// f32At decodes the little-endian float32 at offset off of b, or 0 if b
+// ends before it, as readF32 did for a short read.
+func f32At(b []byte, off int) float32 {
+	if off+4 > len(b) {
 		return 0
 	}
-	v := math.Float32frombits(binary.LittleEndian.Uint32(r.data[r.off:]))
-	r.off += 4
+	return f32le(b[off:])
+}
+
+// vec3At decodes the float32 (x, y, z) at the start of b. Components past
+// the end of b are left zero, as for any other short read.
+func vec3At(b []byte) (v [3]float64) {
+	for i := 0; i < 3 && 4*i+4 <= len(b); i++ {
+		v[i] = float64(f32le(b[4*i:]))
+	}
 	return v
 }
 
@@ -142,31 +165,43 @@ func (r *reader) parse(filepath string) ([]Mesh, []Bone, error) {
 		// Vertices: 16 bytes each (node:i16, pad:i16, x:f32, y:f32, z:f32)
 		verts := make([][3]float32, nv)
 		nodes := make([]int16, nv)
-		for j := 0; j < nv; j++ {
-			nodes[j] = r.readI16()
-			_ = r.readI16() // padding
-			verts[j][0] = r.readF32()
-			verts[j][1] = r.readF32()
-			verts[j][2] = r.readF32()
+		blk := r.block(nv * 16)
+		for j := 0; j < nv && j*16+16 <= len(blk); j++ {
+			v := blk[j*16 : j*16+16]
+			nodes[j] = int16(binary.LittleEndian.Uint16(v[0:2]))
+			verts[j] = [3]float32{f32le(v[4:8]), f32le(v[8:12]), f32le(v[12:16])}
+		}
+		// A truncated last record keeps whichever fields are fully present.
+		if j := len(blk) / 16; j < nv {
+			v := blk[j*16:]
+			if len(v) >= 2 {
+				nodes[j] = int16(binary.LittleEndian.Uint16(v[0:2]))
+			}
+			verts[j] = [3]float32{f32At(v, 4), f32At(v, 8), f32At(v, 12)}
 		}
 
 		// Normals: 20 bytes each (node:i16, pad:i16, nx:f32, ny:f32, nz:f32, bind:i16, pad:i16)
 		normals := make([][3]float32, nn)
-		for j := 0; j < nn; j++ {
-			_ = r.readI16() // node
-			_ = r.readI16() // padding
-			normals[j][0] = r.readF32()
-			normals[j][1] = r.readF32()
-			normals[j][2] = r.readF32()
-			_ = r.readI16() // bindVertex
-			_ = r.readI16() // padding
+		blk = r.block(nn * 20)
+		for j := 0; j < nn && j*20+20 <= len(blk); j++ {
+			v := blk[j*20 : j*20+20]
+			normals[j] = [3]float32{f32le(v[4:8]), f32le(v[8:12]), f32le(v[12:16])}
+		}
+		if j := len(blk) / 20; j < nn {
+			v := blk[j*20:]
+			normals[j] = [3]float32{f32At(v, 4), f32At(v, 8), f32At(v, 12)}
 		}
 
 		// TexCoords: 8 bytes each (u:f32, v:f32)
 		uvs := make([][2]float32, ntc)
-		for j := 0; j < ntc; j++ {
-			uvs[j][0] = r.readF32()
-			uvs[j][1] = r.readF32()
+		blk = r.block(ntc * 8)
+		for j := 0; j < ntc && j*8+8 <= len(blk); j++ {
+			v := blk[j*8 : j*8+8]
+			uvs[j] = [2]float32{f32le(v[0:4]), f32le(v[4:8])}
+		}
+		if j := len(blk) / 8; j < ntc {
+			v := blk[j*8:]
+			uvs[j] = [2]float32{f32At(v, 0), f32At(v, 4)}
 		}
 
 		// Triangles: 64 bytes each
@@ -176,16 +211,13 @@ func (r *reader) parse(filepath string) ([]Mesh, []Bone, error) {
 			if base+64 > len(r.data) {
 				break
 			}
-			poly := int(r.data[base])
+			t := r.data[base : base+64 : base+64]
+			poly := int(t[0])
 			var vi, ni, ti [4]int16
 			for k := 0; k < 4; k++ {
-				vi[k] = int16(binary.LittleEndian.Uint16(r.data[base+2+k*2:]))
-			}
-			for k := 0; k < 4; k++ {
-				ni[k] = int16(binary.LittleEndian.Uint16(r.data[base+10+k*2:]))
-			}
-			for k := 0; k < 4; k++ {
-				ti[k] = int16(binary.LittleEndian.Uint16(r.data[base+18+k*2:]))
+				vi[k] = int16(binary.LittleEndian.Uint16(t[2+k*2:]))
+				ni[k] = int16(binary.LittleEndian.Uint16(t[10+k*2:]))
+				ti[k] = int16(binary.LittleEndian.Uint16(t[18+k*2:]))
 			}
 			tris[j] = Triangle{Polygon: poly, VI: vi, NI: ni, TI: ti}
 			r.off += 64
@@ -234,26 +266,17 @@ func (r *reader) parse(filepath string) ([]Mesh, []Bone, error) {
 			if a < len(actionKeys) {
 				numKeys = actionKeys[a]
 			}
-			if numKeys == 0 {
+			if numKeys <= 0 {
 				continue
 			}
-			// Positions: numKeys × (x, y, z) float32
-			for k := 0; k < numKeys; k++ {
-				px := float64(r.readF32())
-				py := float64(r.readF32())
-				pz := float64(r.readF32())
-				if a == 0 && k == 0 {
-					bindPos = [3]float64{px, py, pz}
-				}
-			}
-			// Rotations: numKeys × (rx, ry, rz) float32
-			for k := 0; k < numKeys; k++ {
-				rx := float64(r.readF32())
-				ry := float64(r.readF32())
-				rz := float64(r.readF32())
-				if a == 0 && k == 0 {
-					bindRot = [3]float64{rx, ry, rz}
-				}
+			// Positions then rotations: numKeys × (x, y, z) float32 each.
+			// Only the first key of the first action is used (the bind
+			// pose); the rest are skipped as whole blocks.
+			pos := r.block(numKeys * 12)
+			rot := r.block(numKeys * 12)
+			if a == 0 {
+				bindPos = vec3At(pos)
+				bindRot = vec3At(rot)
 			}
 		}
 
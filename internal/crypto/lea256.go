@@ -31,42 +31,35 @@ func leaKeySchedule(key [32]byte) [192]uint32 {
 }
 
 // DecryptLEA decrypts data in 16-byte blocks using LEA-256 ECB mode.
-// The input length must be a multiple of 16.
+// The input length should be a multiple of 16; any trailing partial block
+// is copied through unchanged.
 func DecryptLEA(data []byte, key [32]byte) []byte {
 	rk := leaKeySchedule(key)
 	out := make([]byte, len(data))
+	n := len(data) &^ 15
 
-	for off := 0; off < len(data); off += 16 {
-		block := data[off : off+16]
-		s0 := binary.LittleEndian.Uint32(block[0:])
-		s1 := binary.LittleEndian.Uint32(block[4:])
-		s2 := binary.LittleEndian.Uint32(block[8:])
-		s3 := binary.LittleEndian.Uint32(block[12:])
+	for off := 0; off < n; off += 16 {
+		// Fixed-capacity subslices let the compiler drop per-word bounds checks.
+		in := data[off : off+16 : off+16]
+		s0 := binary.LittleEndian.Uint32(in[0:4])
+		s1 := binary.LittleEndian.Uint32(in[4:8])
+		s2 := binary.LittleEndian.Uint32(in[8:12])
+		s3 := binary.LittleEndian.Uint32(in[12:16])
 
-		for r := 31; r >= 0; r-- {
-			base := r * 6
-			rk0 := rk[base]
-			rk1 := rk[base+1]
-			rk2 := rk[base+2]
-			rk3 := rk[base+3]
-			rk4 := rk[base+4]
-			rk5 := rk[base+5]
-
-			t0 := s3
-			t1 := bits.RotateLeft32(s0, -9) - (t0 ^ rk0) ^ rk1
-			t2 := bits.RotateLeft32(s1, 5) - (t1 ^ rk2) ^ rk3
-			t3 := bits.RotateLeft32(s2, 3) - (t2 ^ rk4) ^ rk5
-
-			s0 = t0
-			s1 = t1
-			s2 = t2
-			s3 = t3
+		for base := 31 * 6; base >= 0; base -= 6 {
+			k := rk[base : base+6 : base+6]
+			t1 := bits.RotateLeft32(s0, -9) - (s3 ^ k[0]) ^ k[1]
+			t2 := bits.RotateLeft32(s1, 5) - (t1 ^ k[2]) ^ k[3]
+			t3 := bits.RotateLeft32(s2, 3) - (t2 ^ k[4]) ^ k[5]
+			s0, s1, s2, s3 = s3, t1, t2, t3
 		}
 
-		binary.LittleEndian.PutUint32(out[off+0:], s0)
-		binary.LittleEndian.PutUint32(out[off+4:], s1)
-		binary.LittleEndian.PutUint32(out[off+8:], s2)
-		binary.LittleEndian.PutUint32(out[off+12:], s3)
+		o := out[off : off+16 : off+16]
+		binary.LittleEndian.PutUint32(o[0:4], s0)
+		binary.LittleEndian.PutUint32(o[4:8], s1)
+		binary.LittleEndian.PutUint32(o[8:12], s2)
+		binary.LittleEndian.PutUint32(o[12:16], s3)
 	}
+	copy(out[n:], data[n:])
 	return out
 }
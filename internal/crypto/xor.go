@@ -1,28 +1,111 @@
 package crypto
 
+import "encoding/binary"
+
 // DecryptXOR decrypts BMD v12 data using chained XOR with the 16-byte key.
 // Initial chain value is 0x5E. For each byte:
 //
 //	out[i] = ((data[i] ^ XORKey[i&15]) - chainKey) & 0xFF
 //	chainKey = (data[i] + 0x3D) & 0xFF
+//
+// The chain value depends only on the previous *input* byte, so whole
+// 16-byte key periods are decrypted eight bytes at a time with SWAR
+// (per-byte add/subtract inside a uint64); the tail is done byte-wise.
 func DecryptXOR(data []byte) []byte {
 	out := make([]byte, len(data))
-	chainKey := byte(0x5E)
+	k0 := binary.LittleEndian.Uint64(XORKey[0:8])
+	k1 := binary.LittleEndian.Uint64(XORKey[8:16])
+
+	n := len(data) &^ 15
+	prev := uint64(0x5E - 0x3D) // plays the role of data[-1]
+	for i := 0; i < n; i += 16 {
+		in := data[i : i+16 : i+16]
+		o := out[i : i+16 : i+16]
+		w0 := binary.LittleEndian.Uint64(in[0:8])
+		w1 := binary.LittleEndian.Uint64(in[8:16])
+		binary.LittleEndian.PutUint64(o[0:8], xorChainWord(w0, k0, prev))
+		binary.LittleEndian.PutUint64(o[8:16], xorChainWord(w1, k1, w0>>56))
+		prev = w1 >> 56
+	}
 
-	for i, b := range data {
+	chainKey := byte(prev) + 0x3D
+	for i := n; i < len(data); i++ {
+		b := data[i]
 		out[i] = (b ^ XORKey[i&15]) - chainKey
 		chainKey = b + 0x3D
 	}
 	return out
 }
 
+// xorChainWord applies the DecryptXOR step to the eight bytes in w, with
+// key bytes k and prev holding the input byte that precedes w.
+func xorChainWord(w, k, prev uint64) uint64 {
+	const hi = 0x8080808080808080
+	const lo = ^uint64(hi)
+	const add = 0x3D3D3D3D3D3D3D3D
+
+	chain := w<<8 | prev
+	chain = ((chain & lo) + (add & lo)) ^ ((chain ^ add) & hi) // bytewise +0x3D
+	x := w ^ k
+	return ((x | hi) - (chain & lo)) ^ ((x ^ ^chain) & hi) // bytewise x-chain
+}
+
+// trsKeyWords is TRSXORKey repeated over its 24-byte period (the LCM of the
+// 3-byte key and an 8-byte word) as three little-endian 64-bit words.
+var trsKeyWords = func() (w [3]uint64) {
+	for i := 0; i < 24; i++ {
+		w[i/8] |= uint64(TRSXORKey[i%3]) << (8 * (i % 8))
+	}
+	return w
+}()
+
+// xorTRS writes src ^ TRSXORKey into dst, with the key starting at phase 0.
+// Whole 8-byte words are XORed at once; any remaining bytes go one at a time.
+func xorTRS(dst, src []byte) {
+	dst = dst[:len(src)]
+	n := len(src) &^ 7
+	for i, j := 0, 0; i < n; i += 8 {
+		binary.LittleEndian.PutUint64(dst[i:i+8], binary.LittleEndian.Uint64(src[i:i+8])^trsKeyWords[j])
+		if j++; j == 3 {
+			j = 0
+		}
+	}
+	for i := n; i < len(src); i++ {
+		dst[i] = src[i] ^ TRSXORKey[i%3]
+	}
+}
+
 // DecryptTRS decrypts ItemTRSData.bmd using simple 3-byte repeating XOR.
 //
 //	out[i] = data[i] ^ TRSXORKey[i%3]
 func DecryptTRS(data []byte) []byte {
 	out := make([]byte, len(data))
-	for i, b := range data {
-		out[i] = b ^ TRSXORKey[i%3]
-	}
+	xorTRS(out, data)
+	return out
+}
+
+// DecryptTRSRecords decrypts a run of fixed-size records in a single pass.
+// The 3-byte key restarts at every record boundary, so this is equivalent to
+// calling DecryptTRS on each record but needs only one output allocation.
+// A trailing partial record is decrypted the same way.
+func DecryptTRSRecords(data []byte, recordSize int) []byte {
+	out := make([]byte, len(data))
+	xorTRSRecords(out, data, recordSize)
 	return out
 }
+
+// DecryptTRSRecordsInPlace is DecryptTRSRecords without the output buffer:
+// data is overwritten with its decryption.
+func DecryptTRSRecordsInPlace(data []byte, recordSize int) {
+	xorTRSRecords(data, data, recordSize)
+}
+
+func xorTRSRecords(dst, src []byte, recordSize int) {
+	for off := 0; off < len(src); off += recordSize {
+		end := off + recordSize
+		if end > len(src) {
+			end = len(src)
+		}
+		xorTRS(dst[off:end], src[off:end])
+	}
+}
@@ -0,0 +1,92 @@
+package crypto
+
+import (
+	"bytes"
+	"fmt"
+	"math/rand"
+	"testing"
+)
+
+// decryptXORBytewise is the byte-at-a-time DecryptXOR reference.
+func decryptXORBytewise(data []byte) []byte {
+	out := make([]byte, len(data))
+	chainKey := byte(0x5E)
+	for i, b := range data {
+		out[i] = (b ^ XORKey[i&15]) - chainKey
+		chainKey = b + 0x3D
+	}
+	return out
+}
+
+// xorTestInputs returns inputs of every length 0..64 plus longer odd
+// lengths, filled with random bytes and with patterns that sit on the
+// SWAR lane boundaries (carry and borrow across the high bit of a byte).
+func xorTestInputs() map[string][]byte {
+	rng := rand.New(rand.NewSource(1))
+	inputs := make(map[string][]byte)
+	lengths := []int{65, 79, 127, 129, 255, 1001}
+	for n := 0; n <= 64; n++ {
+		lengths = append(lengths, n)
+	}
+	fills := map[string]func(i int) byte{
+		"zero": func(int) byte { return 0x00 },
+		"ff":   func(int) byte { return 0xFF },
+		"7f80": func(i int) byte { return 0x7F + byte(i&1) },
+		"c2c3": func(i int) byte { return 0xC2 + byte(i&1) }, // 0xC3 + 0x3D wraps to 0x00
+	}
+	for _, n := range lengths {
+		b := make([]byte, n)
+		rng.Read(b)
+		inputs[fmt.Sprintf("random/%d", n)] = b
+		for name, f := range fills {
+			b := make([]byte, n)
+			for i := range b {
+				b[i] = f(i)
+			}
+			inputs[fmt.Sprintf("%s/%d", name, n)] = b
+		}
+	}
+	return inputs
+}
+
+func TestDecryptXORMatchesBytewise(t *testing.T) {
+	for name, in := range xorTestInputs() {
+		if got, want := DecryptXOR(in), decryptXORBytewise(in); !bytes.Equal(got, want) {
+			t.Errorf("%s: DecryptXOR = %x, want %x", name, got, want)
+		}
+	}
+}
+
+// decryptTRSRecordsBytewise is the byte-at-a-time reference for the TRS XOR,
+// restarting the key at every recordSize boundary.
+func decryptTRSRecordsBytewise(data []byte, recordSize int) []byte {
+	out := make([]byte, len(data))
+	for i, b := range data {
+		out[i] = b ^ TRSXORKey[(i%recordSize)%3]
+	}
+	return out
+}
+
+func TestDecryptTRSMatchesBytewise(t *testing.T) {
+	for name, in := range xorTestInputs() {
+		if got, want := DecryptTRS(in), decryptTRSRecordsBytewise(in, len(in)+1); !bytes.Equal(got, want) {
+			t.Errorf("%s: DecryptTRS = %x, want %x", name, got, want)
+		}
+	}
+}
+
+func TestDecryptTRSRecordsMatchesBytewise(t *testing.T) {
+	for name, in := range xorTestInputs() {
+		for _, recordSize := range []int{1, 3, 7, 8, 24, 32, 33} {
+			want := decryptTRSRecordsBytewise(in, recordSize)
+			if got := DecryptTRSRecords(in, recordSize); !bytes.Equal(got, want) {
+				t.Errorf("%s/record%d: DecryptTRSRecords = %x, want %x", name, recordSize, got, want)
+			}
+			got := append([]byte(nil), in...)
+			DecryptTRSRecordsInPlace(got, recordSize)
+			if !bytes.Equal(got, want) {
+				t.Errorf("%s/record%d: DecryptTRSRecordsInPlace = %x, want %x", name, recordSize, got, want)
+			}
+		}
+	}
+}
@@ -24,6 +24,28 @@ var effectPatterns = []string{
 	"arrowbom", "raypiece",
 }
 
+// effectPatternsByFirst buckets effectPatterns by their first byte, so a
+// single left-to-right pass over a stem only tries the patterns that can
+// start at each position.
+var effectPatternsByFirst = func() (t [256][]string) {
+	for _, p := range effectPatterns {
+		t[p[0]] = append(t[p[0]], p)
+	}
+	return t
+}()
+
+// containsEffectPattern reports whether stem contains any of effectPatterns.
+func containsEffectPattern(stem string) bool {
+	for i := 0; i < len(stem); i++ {
+		for _, p := range effectPatternsByFirst[stem[i]] {
+			if strings.HasPrefix(stem[i:], p) {
+				return true
+			}
+		}
+	}
+	return false
+}
+
 // effectPrefixPatterns must match at the START of the texture stem only.
 // "flame" is prefix-only to avoid false positives like "requitalbox_flame_wood"
 // (metal frame of reward box, not a fire effect).
@@ -167,10 +189,8 @@ func IsEffectMesh(m *bmd.Mesh) bool {
 	if gradientEffectRE.MatchString(stem) {
 		return true
 	}
-	for _, p := range effectPatterns {
-		if strings.Contains(stem, p) {
-			return true
-		}
+	if containsEffectPattern(stem) {
+		return true
 	}
 	for _, p := range effectPrefixPatterns {
 		if strings.HasPrefix(stem, p) {
@@ -224,8 +244,21 @@ func FilterComponents(m *bmd.Mesh, minVerts int) bmd.Mesh {
 		return *m
 	}
 
-	// Build adjacency
-	adj := make(map[int][]int)
+	// Union-find over vertices: every triangle edge joins its endpoints.
+	// Only vertices touched by at least one edge belong to a component.
+	nv := len(m.Verts)
+	parent := make([]int32, nv)
+	for i := range parent {
+		parent[i] = int32(i)
+	}
+	find := func(v int32) int32 {
+		for parent[v] != v {
+			parent[v] = parent[parent[v]] // path halving
+			v = parent[v]
+		}
+		return v
+	}
+	linked := make([]bool, nv)
 	for _, tri := range m.Tris {
 		n := 3
 		if tri.Polygon == 4 {
@@ -234,39 +267,54 @@ func FilterComponents(m *bmd.Mesh, minVerts int) bmd.Mesh {
 		for a := 0; a < n; a++ {
 			for b := a + 1; b < n; b++ {
 				va, vb := int(tri.VI[a]), int(tri.VI[b])
-				if va < 0 || va >= len(m.Verts) || vb < 0 || vb >= len(m.Verts) {
+				if va < 0 || va >= nv || vb < 0 || vb >= nv {
 					continue
 				}
-				adj[va] = append(adj[va], vb)
-				adj[vb] = append(adj[vb], va)
+				linked[va], linked[vb] = true, true
+				if ra, rb := find(int32(va)), find(int32(vb)); ra != rb {
+					parent[ra] = rb
+				}
 			}
 		}
 	}
 
-	// BFS connected components
-	visited := make([]bool, len(m.Verts))
-	var components [][]int
-	for v := range m.Verts {
-		if visited[v] || len(adj[v]) == 0 {
+	// Group vertices by root in one pass, accumulating each component's
+	// vertex count, coordinate sum and bounds as we go. Components are
+	// ordered by their lowest vertex.
+	type compStats struct {
+		n        int
+		sum      [3]float64
+		min, max [3]float32
+	}
+	compOf := make([]int32, nv) // component of each root
+	vertComp := make([]int32, nv)
+	for i := range compOf {
+		compOf[i] = -1
+		vertComp[i] = -1
+	}
+	var components []compStats
+	for v := 0; v < nv; v++ {
+		if !linked[v] {
 			continue
 		}
-		comp := []int{}
-		stack := []int{v}
-		for len(stack) > 0 {
-			curr := stack[len(stack)-1]
-			stack = stack[:len(stack)-1]
-			if visited[curr] {
-				continue
+		r := find(int32(v))
+		if compOf[r] < 0 {
+			compOf[r] = int32(len(components))
+			components = append(components, compStats{min: m.Verts[v], max: m.Verts[v]})
+		}
+		vertComp[v] = compOf[r]
+		st := &components[compOf[r]]
+		st.n++
+		p := m.Verts[v]
+		for k := 0; k < 3; k++ {
+			st.sum[k] += float64(p[k])
+			if p[k] < st.min[k] {
+				st.min[k] = p[k]
 			}
-			visited[curr] = true
-			comp = append(comp, curr)
-			for _, nb := range adj[curr] {
-				if !visited[nb] {
-					stack = append(stack, nb)
-				}
+			if p[k] > st.max[k] {
+				st.max[k] = p[k]
 			}
 		}
-		components = append(components, comp)
 	}
 
 	if len(components) <= 1 {
@@ -276,32 +324,13 @@ func FilterComponents(m *bmd.Mesh, minVerts int) bmd.Mesh {
 	// Find largest component
 	largestIdx := 0
 	for i, c := range components {
-		if len(c) > len(components[largestIdx]) {
+		if c.n > components[largestIdx].n {
 			largestIdx = i
 		}
 	}
-	largest := components[largestIdx]
 
-	// Compute largest component center and span
-	var lCenter [3]float64
-	var lMin, lMax [3]float32
-	lMin = m.Verts[largest[0]]
-	lMax = m.Verts[largest[0]]
-	for _, vi := range largest {
-		v := m.Verts[vi]
-		for k := 0; k < 3; k++ {
-			lCenter[k] += float64(v[k])
-			if v[k] < lMin[k] {
-				lMin[k] = v[k]
-			}
-			if v[k] > lMax[k] {
-				lMax[k] = v[k]
-			}
-		}
-	}
-	for k := 0; k < 3; k++ {
-		lCenter[k] /= float64(len(largest))
-	}
+	// Largest component bounds and span
+	lMin, lMax := components[largestIdx].min, components[largestIdx].max
 	var lSpan float64
 	for k := 0; k < 3; k++ {
 		d := float64(lMax[k] - lMin[k])
@@ -310,56 +339,43 @@ func FilterComponents(m *bmd.Mesh, minVerts int) bmd.Mesh {
 		}
 	}
 
-	// Decide which vertices to keep
-	keepVerts := make(map[int]bool)
-	for _, vi := range largest {
-		keepVerts[vi] = true
-	}
+	// Decide which components to keep
+	keepComp := make([]bool, len(components))
 	for i, comp := range components {
-		if i == largestIdx {
+		if i == largestIdx || comp.n >= minVerts {
+			keepComp[i] = true
 			continue
 		}
-		if len(comp) >= minVerts {
-			for _, vi := range comp {
-				keepVerts[vi] = true
-			}
-		} else {
-			// Keep if close to largest component bounding box
-			var cCenter [3]float64
-			for _, vi := range comp {
-				for k := 0; k < 3; k++ {
-					cCenter[k] += float64(m.Verts[vi][k])
-				}
-			}
-			for k := 0; k < 3; k++ {
-				cCenter[k] /= float64(len(comp))
-			}
-			// Distance to nearest point on largest component's bbox
-			var distSq float64
-			for k := 0; k < 3; k++ {
-				lo := float64(lMin[k])
-				hi := float64(lMax[k])
-				c := cCenter[k]
-				if c < lo {
-					d := lo - c
-					distSq += d * d
-				} else if c > hi {
-					d := c - hi
-					distSq += d * d
-				}
-			}
-			if distSq < lSpan*lSpan*0.16 { // 0.4² = 0.16
-				for _, vi := range comp {
-					keepVerts[vi] = true
-				}
+		// Keep if close to largest component bounding box
+		var cCenter [3]float64
+		for k := 0; k < 3; k++ {
+			cCenter[k] = comp.sum[k] / float64(comp.n)
+		}
+		// Distance to nearest point on largest component's bbox
+		var distSq float64
+		for k := 0; k < 3; k++ {
+			lo := float64(lMin[k])
+			hi := float64(lMax[k])
+			c := cCenter[k]
+			if c < lo {
+				d := lo - c
+				distSq += d * d
+			} else if c > hi {
+				d := c - hi
+				distSq += d * d
 			}
 		}
+		keepComp[i] = distSq < lSpan*lSpan*0.16 // 0.4² = 0.16
+	}
+	kept := func(vi int16) bool {
+		v := int(vi)
+		return v >= 0 && v < nv && vertComp[v] >= 0 && keepComp[vertComp[v]]
 	}
 
 	// Filter triangles
 	var filteredTris []bmd.Triangle
 	for _, tri := range m.Tris {
-		if keepVerts[int(tri.VI[0])] && keepVerts[int(tri.VI[1])] && keepVerts[int(tri.VI[2])] {
+		if kept(tri.VI[0]) && kept(tri.VI[1]) && kept(tri.VI[2]) {
 			filteredTris = append(filteredTris, tri)
 		}
 	}
@@ -0,0 +1,168 @@
+package filter
+
+import (
+	"math/rand"
+	"reflect"
+	"testing"
+
+	"mu-bmd-renderer/internal/bmd"
+)
+
+// filterComponentsBFS is the reference for FilterComponents: it finds the
+// components by a depth-first search over an explicit adjacency list and
+// applies the same keep rules.
+func filterComponentsBFS(m *bmd.Mesh, minVerts int) bmd.Mesh {
+	if len(m.Verts) == 0 || len(m.Tris) == 0 || len(m.Verts) <= 2*minVerts {
+		return *m
+	}
+	nv := len(m.Verts)
+	adj := make(map[int][]int)
+	for _, tri := range m.Tris {
+		n := 3
+		if tri.Polygon == 4 {
+			n = 4
+		}
+		for a := 0; a < n; a++ {
+			for b := a + 1; b < n; b++ {
+				va, vb := int(tri.VI[a]), int(tri.VI[b])
+				if va < 0 || va >= nv || vb < 0 || vb >= nv {
+					continue
+				}
+				adj[va] = append(adj[va], vb)
+				adj[vb] = append(adj[vb], va)
+			}
+		}
+	}
+
+	visited := make([]bool, nv)
+	var components [][]int
+	for v := 0; v < nv; v++ {
+		if visited[v] || len(adj[v]) == 0 {
+			continue
+		}
+		var comp []int
+		stack := []int{v}
+		for len(stack) > 0 {
+			cur := stack[len(stack)-1]
+			stack = stack[:len(stack)-1]
+			if visited[cur] {
+				continue
+			}
+			visited[cur] = true
+			comp = append(comp, cur)
+			stack = append(stack, adj[cur]...)
+		}
+		components = append(components, comp)
+	}
+	if len(components) <= 1 {
+		return *m
+	}
+
+	largestIdx := 0
+	for i, c := range components {
+		if len(c) > len(components[largestIdx]) {
+			largestIdx = i
+		}
+	}
+	lMin, lMax := m.Verts[components[largestIdx][0]], m.Verts[components[largestIdx][0]]
+	for _, vi := range components[largestIdx] {
+		for k := 0; k < 3; k++ {
+			lMin[k] = min(lMin[k], m.Verts[vi][k])
+			lMax[k] = max(lMax[k], m.Verts[vi][k])
+		}
+	}
+	var lSpan float64
+	for k := 0; k < 3; k++ {
+		lSpan = max(lSpan, float64(lMax[k]-lMin[k]))
+	}
+
+	keep := make(map[int]bool)
+	for i, comp := range components {
+		keepComp := i == largestIdx || len(comp) >= minVerts
+		if !keepComp {
+			var distSq float64
+			for k := 0; k < 3; k++ {
+				var c float64
+				for _, vi := range comp {
+					c += float64(m.Verts[vi][k])
+				}
+				c /= float64(len(comp))
+				if lo := float64(lMin[k]); c < lo {
+					distSq += (lo - c) * (lo - c)
+				} else if hi := float64(lMax[k]); c > hi {
+					distSq += (c - hi) * (c - hi)
+				}
+			}
+			keepComp = distSq < lSpan*lSpan*0.16
+		}
+		if keepComp {
+			for _, vi := range comp {
+				keep[vi] = true
+			}
+		}
+	}
+
+	var tris []bmd.Triangle
+	for _, tri := range m.Tris {
+		if keep[int(tri.VI[0])] && keep[int(tri.VI[1])] && keep[int(tri.VI[2])] {
+			tris = append(tris, tri)
+		}
+	}
+	result := *m
+	result.Tris = tris
+	return result
+}
+
+// randomClusteredMesh builds a mesh of several vertex clusters of varied
+// size and distance, joined internally by triangles and quads, with some
+// isolated vertices and out-of-range indices mixed in.
+func randomClusteredMesh(rng *rand.Rand) *bmd.Mesh {
+	m := &bmd.Mesh{}
+	for c, nc := 0, 2+rng.Intn(8); c < nc; c++ {
+		first := len(m.Verts)
+		n := 1 + rng.Intn(30)
+		var center [3]float32
+		for k := range center {
+			center[k] = float32(rng.NormFloat64() * 40)
+		}
+		for i := 0; i < n; i++ {
+			var p [3]float32
+			for k := range p {
+				p[k] = center[k] + float32(rng.NormFloat64()*5)
+			}
+			m.Verts = append(m.Verts, p)
+		}
+		pick := func() int16 { return int16(first + rng.Intn(n)) }
+		for t, nt := 0, rng.Intn(2*n); t < nt; t++ {
+			tri := bmd.Triangle{Polygon: 3, VI: [4]int16{pick(), pick(), pick(), 0}}
+			if rng.Intn(4) == 0 {
+				tri.Polygon = 4
+				tri.VI[3] = pick()
+			}
+			switch rng.Intn(20) {
+			case 0:
+				tri.VI[rng.Intn(3)] = -1
+			case 1:
+				tri.VI[rng.Intn(3)] = int16(1000 + rng.Intn(100))
+			}
+			m.Tris = append(m.Tris, tri)
+		}
+	}
+	rng.Shuffle(len(m.Tris), func(i, j int) { m.Tris[i], m.Tris[j] = m.Tris[j], m.Tris[i] })
+	return m
+}
+
+func TestFilterComponentsMatchesBFS(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	for i := 0; i < 2000; i++ {
+		m := randomClusteredMesh(rng)
+		for _, minVerts := range []int{1, 5, 12} {
+			got := FilterComponents(m, minVerts)
+			want := filterComponentsBFS(m, minVerts)
+			if !reflect.DeepEqual(got.Tris, want.Tris) {
+				t.Fatalf("mesh %d, minVerts %d: kept %d triangles %v, want %d %v",
+					i, minVerts, len(got.Tris), got.Tris, len(want.Tris), want.Tris)
+			}
+		}
+	}
+}
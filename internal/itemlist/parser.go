@@ -8,72 +8,98 @@ import (
 	"strings"
 )
 
-// xmlItemList matches the ItemList.xml schema.
-type xmlItemList struct {
-	Sections []xmlSection `xml:"Section"`
-}
-
-type xmlSection struct {
-	Index string    `xml:"Index,attr"`
-	Name  string    `xml:"Name,attr"`
-	Items []xmlItem `xml:"Item"`
-}
-
-type xmlItem struct {
-	Index     string `xml:"Index,attr"`
-	Name      string `xml:"Name,attr"`
-	ModelPath string `xml:"ModelPath,attr"`
-	ModelFile string `xml:"ModelFile,attr"`
-}
-
 // Parse reads ItemList.xml and returns all items with model files.
+//
+// The file is streamed token by token rather than unmarshalled into a
+// document tree: only the Section and Item attributes are kept. Sections
+// are direct children of the root element and items direct children of a
+// section, as in the ItemList.xml schema.
 func Parse(xmlPath string) ([]ItemDef, error) {
-	raw, err := os.ReadFile(xmlPath)
+	f, err := os.Open(xmlPath)
 	if err != nil {
 		return nil, fmt.Errorf("itemlist: read %s: %w", xmlPath, err)
 	}
+	defer f.Close()
 
-	var list xmlItemList
-	if err := xml.Unmarshal(raw, &list); err != nil {
-		return nil, fmt.Errorf("itemlist: parse %s: %w", xmlPath, err)
-	}
-
+	d := xml.NewDecoder(f)
 	var items []ItemDef
-	for _, sec := range list.Sections {
-		secIdx, err := strconv.Atoi(sec.Index)
+	var (
+		depth   int
+		inSec   bool // inside a Section with a valid Index
+		secIdx  int
+		secName string
+	)
+	for {
+		tok, err := d.Token()
 		if err != nil {
-			continue
+			return nil, fmt.Errorf("itemlist: parse %s: %w", xmlPath, err)
 		}
-		for _, item := range sec.Items {
-			if item.ModelFile == "" {
-				continue
+		switch t := tok.(type) {
+		case xml.StartElement:
+			depth++
+			switch {
+			case depth == 2 && t.Name.Local == "Section":
+				secIdx, err = strconv.Atoi(attr(t, "Index"))
+				inSec = err == nil
+				secName = attr(t, "Name")
+			case depth == 3 && inSec && t.Name.Local == "Item":
+				if item, ok := parseItem(t, secIdx, secName); ok {
+					items = append(items, item)
+				}
 			}
-			idx, err := strconv.Atoi(item.Index)
-			if err != nil {
-				continue
+		case xml.EndElement:
+			depth--
+			if depth == 1 {
+				inSec = false
 			}
-
-			// Extract subdirectory from ModelPath.
-			// ModelPath is like "Data\Item\Jewel\" — strip "Data\Item\" prefix
-			// to get subdirectory "Jewel" (or "" for default).
-			subDir := ""
-			mp := strings.ReplaceAll(item.ModelPath, "\\", "/")
-			mp = strings.TrimSuffix(mp, "/")
-			const defaultPrefix = "Data/Item"
-			if strings.HasPrefix(mp, defaultPrefix+"/") {
-				subDir = mp[len(defaultPrefix)+1:]
+			if depth == 0 {
+				// Only the root element is read, as with xml.Unmarshal.
+				return items, nil
 			}
+		}
+	}
+}
 
-			items = append(items, ItemDef{
-				Section:     secIdx,
-				SectionName: sec.Name,
-				Index:       idx,
-				Name:        item.Name,
-				ModelFile:   item.ModelFile,
-				SubDir:      subDir,
-			})
+// attr returns the value of the named attribute, or "" if absent.
+func attr(el xml.StartElement, name string) string {
+	v := ""
+	for _, a := range el.Attr {
+		if a.Name.Local == name {
+			v = a.Value
 		}
 	}
+	return v
+}
+
+// parseItem builds the ItemDef for one <Item> element. ok is false for
+// items without a model file or with a non-numeric index.
+func parseItem(el xml.StartElement, secIdx int, secName string) (ItemDef, bool) {
+	modelFile := attr(el, "ModelFile")
+	if modelFile == "" {
+		return ItemDef{}, false
+	}
+	idx, err := strconv.Atoi(attr(el, "Index"))
+	if err != nil {
+		return ItemDef{}, false
+	}
+
+	// Extract subdirectory from ModelPath.
+	// ModelPath is like "Data\Item\Jewel\" — strip "Data\Item\" prefix
+	// to get subdirectory "Jewel" (or "" for default).
+	subDir := ""
+	mp := strings.ReplaceAll(attr(el, "ModelPath"), "\\", "/")
+	mp = strings.TrimSuffix(mp, "/")
+	const defaultPrefix = "Data/Item"
+	if strings.HasPrefix(mp, defaultPrefix+"/") {
+		subDir = mp[len(defaultPrefix)+1:]
+	}
 
-	return items, nil
+	return ItemDef{
+		Section:     secIdx,
+		SectionName: secName,
+		Index:       idx,
+		Name:        attr(el, "Name"),
+		ModelFile:   modelFile,
+		SubDir:      subDir,
+	}, true
 }
@@ -24,6 +24,21 @@ func Mat4Mul(a, b Mat4) Mat4 {
 	return m
 }
 
+// Mat4MulAffine returns a × b for affine matrices (bottom row 0, 0, 0, 1).
+// The bottom row of b only contributes zeros and the translation column,
+// so those terms are skipped; the result equals Mat4Mul on such inputs.
+func Mat4MulAffine(a, b Mat4) Mat4 {
+	var m Mat4
+	for r := 0; r < 3; r++ {
+		for c := 0; c < 4; c++ {
+			m[r*4+c] = a[r*4+0]*b[0*4+c] + a[r*4+1]*b[1*4+c] + a[r*4+2]*b[2*4+c]
+		}
+		m[r*4+3] += a[r*4+3]
+	}
+	m[15] = 1
+	return m
+}
+
 // MulPoint transforms a 3D point (w=1) by the 4×4 matrix.
 func (m Mat4) MulPoint(v Vec3) Vec3 {
 	return Vec3{
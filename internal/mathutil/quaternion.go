@@ -8,9 +8,9 @@ type Quat [4]float64
 // EulerToQuat converts Euler XYZ (radians) to a quaternion.
 // Matches MU Online's bmdAngleToQuaternion function.
 func EulerToQuat(rx, ry, rz float64) Quat {
-	cx, sx := math.Cos(rx*0.5), math.Sin(rx*0.5)
-	cy, sy := math.Cos(ry*0.5), math.Sin(ry*0.5)
-	cz, sz := math.Cos(rz*0.5), math.Sin(rz*0.5)
+	sx, cx := math.Sincos(rx * 0.5)
+	sy, cy := math.Sincos(ry * 0.5)
+	sz, cz := math.Sincos(rz * 0.5)
 
 	return Quat{
 		sx*cy*cz - cx*sy*sz, // x
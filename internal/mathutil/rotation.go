@@ -32,6 +32,21 @@ func RotZ(a float64) Mat3 {
 	}
 }
 
+// EulerZYX returns RotZ(rz) × RotY(ry) × RotX(rx) written out in closed
+// form. Terms are grouped as the two matrix products would evaluate them,
+// so the result is the same as multiplying the three rotations.
+func EulerZYX(rx, ry, rz float64) Mat3 {
+	cx, sx := math.Cos(rx), math.Sin(rx)
+	cy, sy := math.Cos(ry), math.Sin(ry)
+	cz, sz := math.Cos(rz), math.Sin(rz)
+	czsy, szsy := cz*sy, sz*sy
+	return Mat3{
+		cz * cy, -sz*cx + czsy*sx, sz*sx + czsy*cx,
+		sz * cy, cz*cx + szsy*sx, -(cz * sx) + szsy*cx,
+		-sy, cy * sx, cy * cx,
+	}
+}
+
 // Deg2Rad converts degrees to radians.
 func Deg2Rad(d float64) float64 {
 	return d * math.Pi / 180
@@ -9,96 +9,126 @@ func RemoveSmallClusters(img *image.NRGBA, minRatio float64) *image.NRGBA {
 	w, h := b.Dx(), b.Dy()
 	stride := img.Stride
 
-	// Find non-transparent pixels
-	alpha := make([]bool, w*h)
+	labels, compSizes := labelComponents(img)
+	if len(compSizes) <= 1 {
+		return img
+	}
+
 	totalAlpha := 0
+	for _, n := range compSizes {
+		totalAlpha += n
+	}
+	minSize := int(float64(totalAlpha) * minRatio)
+
+	// Zero out small components
+	result := image.NewNRGBA(b)
+	copy(result.Pix, img.Pix)
+
 	for y := 0; y < h; y++ {
 		for x := 0; x < w; x++ {
-			if img.Pix[y*stride+x*4+3] > 0 {
-				alpha[y*w+x] = true
-				totalAlpha++
+			idx := y*w + x
+			if labels[idx] >= 0 && compSizes[labels[idx]] < minSize {
+				i := y*stride + x*4
+				result.Pix[i] = 0
+				result.Pix[i+1] = 0
+				result.Pix[i+2] = 0
+				result.Pix[i+3] = 0
 			}
 		}
 	}
 
-	if totalAlpha == 0 {
-		return img
-	}
+	return result
+}
 
-	// 8-connected flood fill BFS
-	labels := make([]int, w*h)
-	for i := range labels {
-		labels[i] = -1
-	}
-	var compSizes []int
-	compID := 0
+// labelComponents labels the 8-connected components of non-transparent
+// pixels. labels[y*w+x] is the component ID of a pixel, or -1 if it is
+// transparent; sizes[id] is the pixel count of each component. IDs are
+// numbered in raster order of each component's first pixel.
+//
+// It is a classic two-pass labeler: the first pass gives every pixel a
+// provisional label from its already-visited neighbours (W, NW, N, NE) and
+// records equivalences in a union-find forest; the second pass resolves
+// each label to its root. Unlike a flood fill it needs no queue and touches
+// every pixel a fixed number of times.
+func labelComponents(img *image.NRGBA) (labels []int32, sizes []int) {
+	b := img.Bounds()
+	w, h := b.Dx(), b.Dy()
+	stride := img.Stride
 
-	dx := [8]int{-1, 0, 1, -1, 1, -1, 0, 1}
-	dy := [8]int{-1, -1, -1, 0, 0, 1, 1, 1}
+	labels = make([]int32, w*h)
+	parent := make([]int32, 0, 256)
 
-	queue := make([]int, 0, 1024)
+	find := func(l int32) int32 {
+		for parent[l] != l {
+			parent[l] = parent[parent[l]] // path halving
+			l = parent[l]
+		}
+		return l
+	}
+	union := func(a, b int32) int32 {
+		ra, rb := find(a), find(b)
+		if ra < rb {
+			parent[rb] = ra
+			return ra
+		}
+		parent[ra] = rb
+		return rb
+	}
 
+	// Pass 1: provisional labels.
 	for y := 0; y < h; y++ {
+		row := labels[y*w : y*w+w]
+		var prev []int32
+		if y > 0 {
+			prev = labels[(y-1)*w : y*w]
+		}
+		pix := img.Pix[y*stride:]
 		for x := 0; x < w; x++ {
-			idx := y*w + x
-			if !alpha[idx] || labels[idx] >= 0 {
+			if pix[x*4+3] == 0 {
+				row[x] = -1
 				continue
 			}
-
-			// BFS from this pixel
-			queue = queue[:0]
-			queue = append(queue, idx)
-			labels[idx] = compID
-			size := 0
-
-			for len(queue) > 0 {
-				curr := queue[0]
-				queue = queue[1:]
-				size++
-
-				cy := curr / w
-				cx := curr % w
-				for d := 0; d < 8; d++ {
-					nx := cx + dx[d]
-					ny := cy + dy[d]
-					if nx < 0 || nx >= w || ny < 0 || ny >= h {
+			l := int32(-1)
+			if x > 0 && row[x-1] >= 0 {
+				l = row[x-1]
+			}
+			if prev != nil {
+				for nx := x - 1; nx <= x+1; nx++ {
+					if nx < 0 || nx >= w || prev[nx] < 0 {
 						continue
 					}
-					ni := ny*w + nx
-					if alpha[ni] && labels[ni] < 0 {
-						labels[ni] = compID
-						queue = append(queue, ni)
+					if l < 0 {
+						l = prev[nx]
+					} else if prev[nx] != l {
+						l = union(l, prev[nx])
 					}
 				}
 			}
-
-			compSizes = append(compSizes, size)
-			compID++
+			if l < 0 {
+				l = int32(len(parent))
+				parent = append(parent, l)
+			}
+			row[x] = l
 		}
 	}
 
-	if compID <= 1 {
-		return img
+	// Pass 2: resolve roots and renumber in raster order of first pixel.
+	final := make([]int32, len(parent))
+	for i := range final {
+		final[i] = -1
 	}
-
-	minSize := int(float64(totalAlpha) * minRatio)
-
-	// Zero out small components
-	result := image.NewNRGBA(b)
-	copy(result.Pix, img.Pix)
-
-	for y := 0; y < h; y++ {
-		for x := 0; x < w; x++ {
-			idx := y*w + x
-			if labels[idx] >= 0 && compSizes[labels[idx]] < minSize {
-				i := y*stride + x*4
-				result.Pix[i] = 0
-				result.Pix[i+1] = 0
-				result.Pix[i+2] = 0
-				result.Pix[i+3] = 0
-			}
+	for i, l := range labels {
+		if l < 0 {
+			continue
 		}
+		r := find(l)
+		if final[r] < 0 {
+			final[r] = int32(len(sizes))
+			sizes = append(sizes, 0)
+		}
+		id := final[r]
+		labels[i] = id
+		sizes[id]++
 	}
-
-	return result
+	return labels, sizes
 }
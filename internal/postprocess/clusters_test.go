@@ -0,0 +1,109 @@
+package postprocess
+
+import (
+	"fmt"
+	"image"
+	"math/rand"
+	"testing"
+)
+
+// labelComponentsFlood is the 8-connected flood-fill reference for
+// labelComponents: components are numbered in raster order of their first
+// pixel.
+func labelComponentsFlood(img *image.NRGBA) ([]int32, []int) {
+	b := img.Bounds()
+	w, h := b.Dx(), b.Dy()
+	labels := make([]int32, w*h)
+	for i := range labels {
+		labels[i] = -1
+	}
+	var sizes []int
+	var stack []int
+	for start := range labels {
+		if labels[start] >= 0 || img.Pix[(start/w)*img.Stride+(start%w)*4+3] == 0 {
+			continue
+		}
+		id := int32(len(sizes))
+		sizes = append(sizes, 0)
+		labels[start] = id
+		stack = append(stack[:0], start)
+		for len(stack) > 0 {
+			cur := stack[len(stack)-1]
+			stack = stack[:len(stack)-1]
+			sizes[id]++
+			cx, cy := cur%w, cur/w
+			for ny := cy - 1; ny <= cy+1; ny++ {
+				for nx := cx - 1; nx <= cx+1; nx++ {
+					if nx < 0 || nx >= w || ny < 0 || ny >= h {
+						continue
+					}
+					ni := ny*w + nx
+					if labels[ni] < 0 && img.Pix[ny*img.Stride+nx*4+3] != 0 {
+						labels[ni] = id
+						stack = append(stack, ni)
+					}
+				}
+			}
+		}
+	}
+	return labels, sizes
+}
+
+func checkLabelComponents(t *testing.T, name string, img *image.NRGBA) {
+	t.Helper()
+	labels, sizes := labelComponents(img)
+	wantLabels, wantSizes := labelComponentsFlood(img)
+	if fmt.Sprint(sizes) != fmt.Sprint(wantSizes) {
+		t.Fatalf("%s: sizes = %v, want %v", name, sizes, wantSizes)
+	}
+	for i := range wantLabels {
+		if labels[i] != wantLabels[i] {
+			t.Fatalf("%s: label of pixel %d = %d, want %d", name, i, labels[i], wantLabels[i])
+		}
+	}
+}
+
+func TestLabelComponentsMatchesFloodFill(t *testing.T) {
+	rng := rand.New(rand.NewSource(1))
+	dims := [][2]int{{1, 1}, {1, 40}, {40, 1}, {2, 2}, {17, 13}, {64, 64}, {131, 7}}
+	for _, d := range dims {
+		for _, density := range []float64{0.1, 0.3, 0.45, 0.6, 0.9, 1} {
+			for trial := 0; trial < 10; trial++ {
+				img := image.NewNRGBA(image.Rect(0, 0, d[0], d[1]))
+				for i := 3; i < len(img.Pix); i += 4 {
+					if rng.Float64() < density {
+						img.Pix[i] = uint8(1 + rng.Intn(255))
+					}
+				}
+				checkLabelComponents(t, fmt.Sprintf("%dx%d/%g/%d", d[0], d[1], density, trial), img)
+			}
+		}
+	}
+
+	// A comb whose teeth only join on the last row, and a diagonal staircase
+	// that is connected through corners alone: both merge labels late.
+	comb := image.NewNRGBA(image.Rect(0, 0, 31, 20))
+	for y := 0; y < 20; y++ {
+		for x := 0; x < 31; x++ {
+			if x%2 == 0 || y == 19 {
+				comb.Pix[y*comb.Stride+x*4+3] = 255
+			}
+		}
+	}
+	checkLabelComponents(t, "comb", comb)
+	stairs := image.NewNRGBA(image.Rect(0, 0, 30, 30))
+	for i := 0; i < 30; i++ {
+		stairs.Pix[i*stairs.Stride+(29-i)*4+3] = 255
+		stairs.Pix[i*stairs.Stride+i*4+3] = 255
+	}
+	checkLabelComponents(t, "stairs", stairs)
+
+	// A sub-image, whose stride is wider than its bounds.
+	big := image.NewNRGBA(image.Rect(0, 0, 50, 50))
+	for i := 3; i < len(big.Pix); i += 4 {
+		if rng.Float64() < 0.45 {
+			big.Pix[i] = 255
+		}
+	}
+	checkLabelComponents(t, "subimage", big.SubImage(image.Rect(7, 9, 40, 33)).(*image.NRGBA))
+}
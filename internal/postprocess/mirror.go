@@ -93,61 +93,8 @@ func keepLargestComponent(img *image.NRGBA) *image.NRGBA {
 	w, h := b.Dx(), b.Dy()
 	stride := img.Stride
 
-	// Build alpha mask
-	alpha := make([]bool, w*h)
-	for y := 0; y < h; y++ {
-		for x := 0; x < w; x++ {
-			if img.Pix[y*stride+x*4+3] > 0 {
-				alpha[y*w+x] = true
-			}
-		}
-	}
-
-	// BFS to label connected components
-	labels := make([]int, w*h)
-	for i := range labels {
-		labels[i] = -1
-	}
-	var compSizes []int
-	compID := 0
-
-	dx := [8]int{-1, 0, 1, -1, 1, -1, 0, 1}
-	dy := [8]int{-1, -1, -1, 0, 0, 1, 1, 1}
-	queue := make([]int, 0, 1024)
-
-	for y := 0; y < h; y++ {
-		for x := 0; x < w; x++ {
-			idx := y*w + x
-			if !alpha[idx] || labels[idx] >= 0 {
-				continue
-			}
-			queue = queue[:0]
-			queue = append(queue, idx)
-			labels[idx] = compID
-			size := 0
-			for len(queue) > 0 {
-				curr := queue[0]
-				queue = queue[1:]
-				size++
-				cy := curr / w
-				cx := curr % w
-				for d := 0; d < 8; d++ {
-					nx := cx + dx[d]
-					ny := cy + dy[d]
-					if nx < 0 || nx >= w || ny < 0 || ny >= h {
-						continue
-					}
-					ni := ny*w + nx
-					if alpha[ni] && labels[ni] < 0 {
-						labels[ni] = compID
-						queue = append(queue, ni)
-					}
-				}
-			}
-			compSizes = append(compSizes, size)
-			compID++
-		}
-	}
+	labels, compSizes := labelComponents(img)
+	compID := len(compSizes)
 
 	// Only one or zero components — nothing to isolate
 	if compID <= 1 {
@@ -168,7 +115,7 @@ func keepLargestComponent(img *image.NRGBA) *image.NRGBA {
 	for y := 0; y < h; y++ {
 		for x := 0; x < w; x++ {
 			idx := y*w + x
-			if labels[idx] >= 0 && labels[idx] != bestID {
+			if labels[idx] >= 0 && int(labels[idx]) != bestID {
 				i := y*stride + x*4
 				result.Pix[i] = 0
 				result.Pix[i+1] = 0
@@ -21,42 +21,34 @@ func StandardizeImage(img *image.NRGBA, canvasW, canvasH int, targetAngleDeg, fi
 	b := img.Bounds()
 	w, h := b.Dx(), b.Dy()
 
-	// Collect non-transparent pixel coordinates
-	var xs, ys []float64
+	// PCA: covariance of non-transparent pixel positions, accumulated as
+	// exact integer moments in one pass instead of collecting coordinates.
+	var cnt, sx, sy, sxx, sxy, syy int64
 	for y := 0; y < h; y++ {
+		row := img.Pix[y*img.Stride:]
 		for x := 0; x < w; x++ {
-			if img.Pix[y*img.Stride+x*4+3] > 0 {
-				xs = append(xs, float64(x))
-				ys = append(ys, float64(y))
+			if row[x*4+3] > 0 {
+				xi, yi := int64(x), int64(y)
+				cnt++
+				sx += xi
+				sy += yi
+				sxx += xi * xi
+				sxy += xi * yi
+				syy += yi * yi
 			}
 		}
 	}
 
-	if len(xs) < 10 {
+	if cnt < 10 {
 		return img
 	}
 
-	// PCA: compute covariance matrix of pixel positions
-	n := float64(len(xs))
-	var meanX, meanY float64
-	for i := range xs {
-		meanX += xs[i]
-		meanY += ys[i]
-	}
-	meanX /= n
-	meanY /= n
-
-	var covXX, covXY, covYY float64
-	for i := range xs {
-		dx := xs[i] - meanX
-		dy := ys[i] - meanY
-		covXX += dx * dx
-		covXY += dx * dy
-		covYY += dy * dy
-	}
-	covXX /= n
-	covXY /= n
-	covYY /= n
+	n := float64(cnt)
+	meanX := float64(sx) / n
+	meanY := float64(sy) / n
+	covXX := float64(sxx)/n - meanX*meanX
+	covXY := float64(sxy)/n - meanX*meanY
+	covYY := float64(syy)/n - meanY*meanY
 
 	// Eigendecomposition of 2×2 symmetric matrix
 	_, _, evec1, _ := mathutil.Eigen2x2Sym(covXX, covXY, covYY)
@@ -81,19 +73,24 @@ func StandardizeImage(img *image.NRGBA, canvasW, canvasH int, targetAngleDeg, fi
 	// Rotate image
 	rotated := rotateImage(img, pilRotate)
 
+	// One scan of the rotated image finds the content bounding box; it is
+	// shared by the flip detection and the crop below.
+	bbox, count := alphaBounds(rotated)
+
 	// Auto-detect orientation on the rotated image:
 	// Project rotated pixels along target direction, check which half is wider
-	needFlip := detectFlipRotated(rotated, targetImg)
+	needFlip := detectFlipRotated(rotated, bbox, count, targetImg)
 	if forceFlip {
 		needFlip = !needFlip
 	}
+
+	// Crop to bounding box of non-transparent pixels, then flip only the
+	// cropped region, which gives the same pixels as cropping the flipped image.
+	cropped := cropTo(rotated, bbox)
 	if needFlip {
-		rotated = rotate180(rotated)
+		cropped = rotate180(cropped)
 	}
 
-	// Crop to bounding box of non-transparent pixels
-	cropped := cropAlpha(rotated)
-
 	// Scale to fill_ratio of canvas and center
 	return scaleAndCenter(cropped, canvasW, canvasH, fillRatio)
 }
@@ -102,89 +99,71 @@ func StandardizeImage(img *image.NRGBA, canvasW, canvasH int, targetAngleDeg, fi
 // Projects pixels along the target angle direction and compares
 // perpendicular spread of top-left vs bottom-right halves.
 // Matches Python's approach: std-based spread comparison on rotated pixels.
-func detectFlipRotated(rotated *image.NRGBA, targetImgDeg float64) bool {
-	b := rotated.Bounds()
-	w, h := b.Dx(), b.Dy()
-
-	// Collect non-transparent pixel coordinates
-	var rxs, rys []float64
-	var minX, maxX, minY, maxY float64
-	first := true
-	for y := 0; y < h; y++ {
-		for x := 0; x < w; x++ {
-			if rotated.Pix[y*rotated.Stride+x*4+3] > 0 {
-				fx, fy := float64(x), float64(y)
-				rxs = append(rxs, fx)
-				rys = append(rys, fy)
-				if first {
-					minX, maxX = fx, fx
-					minY, maxY = fy, fy
-				}
-				if fx < minX {
-					minX = fx
-				}
-				if fx > maxX {
-					maxX = fx
-				}
-				if fy < minY {
-					minY = fy
-				}
-				if fy > maxY {
-					maxY = fy
-				}
-				first = false
-			}
-		}
-	}
-
-	if len(rxs) < 20 {
+// bbox and count are the content bounds and pixel count from alphaBounds.
+func detectFlipRotated(rotated *image.NRGBA, bbox image.Rectangle, count int, targetImgDeg float64) bool {
+	if count < 20 {
 		return false
 	}
+	minX, minY := bbox.Min.X, bbox.Min.Y
+	maxX, maxY := bbox.Max.X-1, bbox.Max.Y-1
 
 	// Center of bounding box
-	cx := (minX + maxX) / 2.0
-	cy := (minY + maxY) / 2.0
+	cx := float64(minX+maxX) / 2.0
+	cy := float64(minY+maxY) / 2.0
 
 	// Target direction vector in image space
 	rad := targetImgDeg * math.Pi / 180.0
 	diagX := math.Cos(rad)
 	diagY := math.Sin(rad)
 
-	// Project pixels along target direction, compute perpendicular spread per half
-	// neg_half = top-left (proj < 0), pos_half = bottom-right (proj >= 0)
-	var negPerps, posPerps []float64
-	for i := range rxs {
-		dx := rxs[i] - cx
-		dy := rys[i] - cy
-		proj := dx*diagX + dy*diagY
-		perp := -dx*diagY + dy*diagX
-
-		if proj < 0 {
-			negPerps = append(negPerps, perp)
-		} else {
-			posPerps = append(posPerps, perp)
+	// Project pixels along target direction and accumulate the perpendicular
+	// spread per half: neg = top-left (proj < 0), pos = bottom-right (proj >= 0)
+	var neg, pos spread
+	for y := minY; y <= maxY; y++ {
+		row := rotated.Pix[y*rotated.Stride:]
+		dy := float64(y) - cy
+		for x := minX; x <= maxX; x++ {
+			if row[x*4+3] == 0 {
+				continue
+			}
+			dx := float64(x) - cx
+			proj := dx*diagX + dy*diagY
+			perp := -dx*diagY + dy*diagX
+
+			if proj < 0 {
+				neg.add(perp)
+			} else {
+				pos.add(perp)
+			}
 		}
 	}
 
-	spreadTL := stddev(negPerps)
-	spreadBR := stddev(posPerps)
+	spreadTL := neg.stddev()
+	spreadBR := pos.stddev()
 
 	// Wider end should be at top-left; flip if bottom-right is wider
 	return spreadBR > spreadTL*1.2
 }
 
-func stddev(vals []float64) float64 {
-	if len(vals) < 10 {
+// spread accumulates the running moments needed for a standard deviation.
+type spread struct {
+	n         int
+	sum, sum2 float64
+}
+
+func (s *spread) add(v float64) {
+	s.n++
+	s.sum += v
+	s.sum2 += v * v
+}
+
+func (s *spread) stddev() float64 {
+	if s.n < 10 {
 		return 0
 	}
-	n := float64(len(vals))
-	var sum, sum2 float64
-	for _, v := range vals {
-		sum += v
-		sum2 += v * v
-	}
-	mean := sum / n
-	variance := sum2/n - mean*mean
+	n := float64(s.n)
+	mean := s.sum / n
+	variance := s.sum2/n - mean*mean
 	if variance < 0 {
 		variance = 0
 	}
@@ -286,15 +265,20 @@ func rotate180(img *image.NRGBA) *image.NRGBA {
 	return dst
 }
 
-func cropAlpha(img *image.NRGBA) *image.NRGBA {
+// alphaBounds returns the bounding box of the non-transparent pixels of an
+// image whose bounds start at the origin, along with their count. The box
+// is empty when there are none.
+func alphaBounds(img *image.NRGBA) (bbox image.Rectangle, count int) {
 	b := img.Bounds()
 	w, h := b.Dx(), b.Dy()
 
 	minX, minY := w, h
-	maxX, maxY := 0, 0
+	maxX, maxY := -1, -1
 	for y := 0; y < h; y++ {
+		row := img.Pix[y*img.Stride:]
 		for x := 0; x < w; x++ {
-			if img.Pix[y*img.Stride+x*4+3] > 0 {
+			if row[x*4+3] > 0 {
+				count++
 				if x < minX {
 					minX = x
 				}
@@ -310,13 +294,27 @@ func cropAlpha(img *image.NRGBA) *image.NRGBA {
 			}
 		}
 	}
+	if count == 0 {
+		return image.Rectangle{}, 0
+	}
+	return image.Rect(minX, minY, maxX+1, maxY+1), count
+}
 
-	if maxX <= minX || maxY <= minY {
+func cropAlpha(img *image.NRGBA) *image.NRGBA {
+	bbox, _ := alphaBounds(img)
+	return cropTo(img, bbox)
+}
+
+// cropTo copies the bbox region of img into a new image. Content only one
+// pixel wide or tall (or none) leaves img uncropped.
+func cropTo(img *image.NRGBA, bbox image.Rectangle) *image.NRGBA {
+	if bbox.Dx() <= 1 || bbox.Dy() <= 1 {
 		return img
 	}
 
-	cropW := maxX - minX + 1
-	cropH := maxY - minY + 1
+	minX, minY := bbox.Min.X, bbox.Min.Y
+	cropW := bbox.Dx()
+	cropH := bbox.Dy()
 	cropped := image.NewNRGBA(image.Rect(0, 0, cropW, cropH))
 	for y := 0; y < cropH; y++ {
 		srcOff := (minY+y)*img.Stride + minX*4
@@ -349,27 +347,13 @@ func scaleAndCenter(img *image.NRGBA, canvasW, canvasH int, fillRatio float64) *
 		newH = 1
 	}
 
-	// Resize
-	scaled := image.NewNRGBA(image.Rect(0, 0, newW, newH))
-	draw.CatmullRom.Scale(scaled, scaled.Bounds(), img, img.Bounds(), draw.Src, nil)
-
-	// Center on canvas
+	// Resize straight into the centered rectangle of the canvas; Scale
+	// clips to the canvas bounds, so no intermediate image is needed.
 	canvas := image.NewNRGBA(image.Rect(0, 0, canvasW, canvasH))
 	offX := (canvasW - newW) / 2
 	offY := (canvasH - newH) / 2
-	for y := 0; y < newH; y++ {
-		srcOff := y * scaled.Stride
-		dstOff := (offY+y)*canvas.Stride + offX*4
-		if offY+y >= 0 && offY+y < canvasH {
-			copyLen := newW * 4
-			if offX+newW > canvasW {
-				copyLen = (canvasW - offX) * 4
-			}
-			if offX >= 0 && copyLen > 0 {
-				copy(canvas.Pix[dstOff:dstOff+copyLen], scaled.Pix[srcOff:srcOff+copyLen])
-			}
-		}
-	}
+	dr := image.Rect(offX, offY, offX+newW, offY+newH)
+	draw.CatmullRom.Scale(canvas, dr, img, img.Bounds(), draw.Src, nil)
 
 	return canvas
 }
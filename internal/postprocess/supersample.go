@@ -14,17 +14,19 @@ func Downsample(img *image.NRGBA, targetW, targetH int) *image.NRGBA {
 		return img
 	}
 
-	// Premultiply alpha
+	// Premultiply alpha. round(c*a/255) in integers: c*a/255 is never
+	// exactly halfway, so this matches the float rounding bit for bit.
 	premul := image.NewRGBA(b)
+	w := b.Dx()
 	for y := b.Min.Y; y < b.Max.Y; y++ {
-		for x := b.Min.X; x < b.Max.X; x++ {
-			si := img.PixOffset(x, y)
-			di := premul.PixOffset(x, y)
-			a := float64(img.Pix[si+3]) / 255.0
-			premul.Pix[di] = uint8(float64(img.Pix[si])*a + 0.5)
-			premul.Pix[di+1] = uint8(float64(img.Pix[si+1])*a + 0.5)
-			premul.Pix[di+2] = uint8(float64(img.Pix[si+2])*a + 0.5)
-			premul.Pix[di+3] = img.Pix[si+3]
+		src := img.Pix[img.PixOffset(b.Min.X, y):][: w*4 : w*4]
+		dst := premul.Pix[premul.PixOffset(b.Min.X, y):][: w*4 : w*4]
+		for i := 0; i < len(src); i += 4 {
+			a := uint32(src[i+3])
+			dst[i] = uint8((uint32(src[i])*a + 127) / 255)
+			dst[i+1] = uint8((uint32(src[i+1])*a + 127) / 255)
+			dst[i+2] = uint8((uint32(src[i+2])*a + 127) / 255)
+			dst[i+3] = src[i+3]
 		}
 	}
 
@@ -34,24 +36,30 @@ func Downsample(img *image.NRGBA, targetW, targetH int) *image.NRGBA {
 
 	// Unpremultiply alpha
 	result := image.NewNRGBA(dst.Bounds())
-	for y := 0; y < targetH; y++ {
-		for x := 0; x < targetW; x++ {
-			si := dst.PixOffset(x, y)
-			di := result.PixOffset(x, y)
-			a := float64(dst.Pix[si+3])
-			if a > 1 {
-				inv := 255.0 / a
-				result.Pix[di] = clamp8(float64(dst.Pix[si]) * inv)
-				result.Pix[di+1] = clamp8(float64(dst.Pix[si+1]) * inv)
-				result.Pix[di+2] = clamp8(float64(dst.Pix[si+2]) * inv)
-			}
-			result.Pix[di+3] = dst.Pix[si+3]
+	for i := 0; i < len(dst.Pix); i += 4 {
+		px := dst.Pix[i : i+4 : i+4]
+		out := result.Pix[i : i+4 : i+4]
+		if a := px[3]; a > 1 {
+			inv := unpremulScale[a]
+			out[0] = clamp8(float64(px[0]) * inv)
+			out[1] = clamp8(float64(px[1]) * inv)
+			out[2] = clamp8(float64(px[2]) * inv)
 		}
+		out[3] = px[3]
 	}
 
 	return result
 }
 
+// unpremulScale[a] is 255/a, the factor that undoes premultiplication by
+// alpha a (entries 0 and 1 are unused).
+var unpremulScale = func() (t [256]float64) {
+	for a := 2; a < 256; a++ {
+		t[a] = 255.0 / float64(a)
+	}
+	return t
+}()
+
 func clamp8(v float64) uint8 {
 	if v < 0 {
 		return 0
@@ -7,15 +7,20 @@ type FrameBuffer struct {
 	Width  int
 	Height int
 	Color  []uint8   // RGBA interleaved, len = W*H*4
-	ZBuf   []float64 // depth per pixel, len = W*H, initialized to -inf
+	ZBuf   []float32 // depth per pixel, len = W*H, initialized to -inf
 }
 
+// zEmpty marks a z-buffer entry no opaque fragment has written. Depth is
+// stored in single precision: it only orders fragments, and halving the
+// buffer halves the memory every depth test touches.
+var zEmpty = float32(math.Inf(-1))
+
 // NewFrameBuffer allocates a zeroed color buffer and -inf z-buffer.
 func NewFrameBuffer(w, h int) *FrameBuffer {
 	n := w * h
-	zbuf := make([]float64, n)
+	zbuf := make([]float32, n)
 	for i := range zbuf {
-		zbuf[i] = math.Inf(-1)
+		zbuf[i] = zEmpty
 	}
 	return &FrameBuffer{
 		Width:  w,
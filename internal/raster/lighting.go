@@ -77,6 +77,54 @@ func init() {
 	for i := 0; i < 256; i++ {
 		srgbToLinear[i] = math.Pow(float64(i)/255.0, 2.2)
 	}
+	for i := range linearToSRGB {
+		s := float64(i) / encodeLUTSize
+		linearToSRGB[i] = math.Pow(s*s, 1.0/2.2)
+	}
+}
+
+// Precomputed linear-to-sRGB table for the default 1/2.2 encode, indexed by
+// sqrt(t) so the steep toe near black stays accurate under interpolation.
+// Measured max error is ~0.0032 of an 8-bit step above the first cell and
+// ~0.0164 inside it (t < 2^-20), where t^(1/2.2) is still steep in sqrt(t).
+const encodeLUTSize = 1024
+
+var linearToSRGB [encodeLUTSize + 1]float64
+
+// encodeGamma returns math.Pow(t, invGamma), using the lookup table for the
+// default gamma and t in [0, 1).
+func encodeGamma(t, invGamma float64) float64 {
+	if !(t > 0) {
+		return 0
+	}
+	if t >= 1 || invGamma != 1.0/2.2 {
+		return math.Pow(t, invGamma)
+	}
+	f := math.Sqrt(t) * encodeLUTSize
+	i := int(f)
+	a := linearToSRGB[i]
+	return a + (linearToSRGB[i+1]-a)*(f-float64(i))
+}
+
+// shadeChannel lights one sRGB channel value with the combined
+// shade*exposure factor, tone maps it and re-encodes it to sRGB, scaled to
+// 0..255 (not yet rounded or clamped). The rasterizers spell the same
+// expression out inline on their per-pixel path.
+func shadeChannel(c uint8, shadeExp, invGamma float64) float64 {
+	return encodeGamma(ACESTonemap(srgbToLinear[c]*shadeExp), invGamma) * 255
+}
+
+// shadeLUT caches shadeChannel for all 256 channel values at one shade.
+type shadeLUT [256]float64
+
+// shadeLUTMinArea is the bounding-box area (pixels) from which building a
+// shadeLUT is cheaper than shading each covered pixel directly.
+const shadeLUTMinArea = 256
+
+func (t *shadeLUT) build(shadeExp, invGamma float64) {
+	for c := range t {
+		t[c] = shadeChannel(uint8(c), shadeExp, invGamma)
+	}
 }
 
 // ACESTonemap applies ACES Filmic tone mapping to a linear value.
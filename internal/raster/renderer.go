@@ -2,6 +2,7 @@ package raster
 
 import (
 	"image"
+	"image/color"
 	"math"
 	"path/filepath"
 	"strings"
@@ -27,7 +28,7 @@ func RenderBMD(
 	// Pre-filter effect meshes and body meshes on raw geometry (before bone transforms distort shapes)
 	// Always apply exclude_textures filter, even with keep_all_meshes.
 	if entry != nil && len(entry.ExcludeTextures) > 0 {
-		var kept []bmd.Mesh
+		kept := make([]bmd.Mesh, 0, len(meshes))
 		for i := range meshes {
 			if !isExcludedTexture(meshes[i].TexPath, entry) {
 				kept = append(kept, meshes[i])
@@ -40,7 +41,7 @@ func RenderBMD(
 
 	keepAll := entry != nil && entry.KeepAllMeshes
 	if !keepAll {
-		var nonEffect []bmd.Mesh
+		nonEffect := make([]bmd.Mesh, 0, len(meshes))
 		for i := range meshes {
 			if filter.IsEffectMesh(&meshes[i]) && !isForceAdditive(meshes[i].TexPath, entry) {
 				continue
@@ -197,8 +198,20 @@ func RenderBMD(
 	// they are surface decorations (shield ornaments, embossed details)
 	// designed to render through the body mesh in the game engine.
 	type meshBBox struct{ minX, minY, maxX, maxY float64 }
-	meshBounds := make([]meshBBox, len(opaqueMeshes))
-	for i, mesh := range opaqueMeshes {
+	// Bounds are only read by TGA meshes after the first and for the meshes
+	// before them, so project no further than the last such mesh.
+	lastTGA := 0
+	for i := len(opaqueMeshes) - 1; i > 0; i-- {
+		if strings.HasSuffix(strings.ToLower(opaqueMeshes[i].TexPath), ".tga") {
+			lastTGA = i
+			break
+		}
+	}
+	var meshBounds []meshBBox
+	if lastTGA > 0 {
+		meshBounds = make([]meshBBox, lastTGA+1)
+	}
+	for i, mesh := range opaqueMeshes[:len(meshBounds)] {
 		bb := meshBBox{math.Inf(1), math.Inf(1), math.Inf(-1), math.Inf(-1)}
 		px, py, _ := viewmatrix.ProjectVertices(mesh.Verts, R, center, scale, renderW, renderH, entry, posCamera)
 		for j := range px {
@@ -662,20 +675,22 @@ func rasterizeMeshInner(
 	blendMode int,
 ) {
 	var tex *image.NRGBA
+	var avg color.NRGBA
 	if texResolver != nil {
-		tex = texResolver.Resolve(mesh.TexPath)
+		tex, avg = texResolver.ResolveAverage(mesh.TexPath)
 	}
 
 	// Apply color tint if specified
 	if entry != nil && tex != nil && (entry.Tint[0] != 0 || entry.Tint[1] != 0 || entry.Tint[2] != 0) {
 		if shouldTintMesh(mesh.TexPath, entry) {
 			tex = applyTint(tex, entry.Tint)
+			avg = texture.AverageColor(tex)
 		}
 	}
 
 	var defR, defG, defB, defA uint8 = 160, 160, 170, 255
 	if tex != nil {
-		defR, defG, defB, defA = averageColor(tex)
+		defR, defG, defB, defA = avg.R, avg.G, avg.B, avg.A
 	}
 
 	type rasterFunc func(*FrameBuffer, []float64, []float64, []float64, [][2]float32, [3]int, [3]int, *image.NRGBA, uint8, uint8, uint8, uint8, *LightConfig)
@@ -829,12 +844,11 @@ func isBrightGlowJPEG(m *bmd.Mesh, texResolver texture.Resolver) bool {
 	if ext != ".jpg" && ext != ".jpeg" {
 		return false
 	}
-	tex := texResolver.Resolve(m.TexPath)
+	tex, avg := texResolver.ResolveAverage(m.TexPath)
 	if tex == nil {
 		return false
 	}
-	r, g, b, _ := averageColor(tex)
-	fr, fg, fb := float64(r), float64(g), float64(b)
+	fr, fg, fb := float64(avg.R), float64(avg.G), float64(avg.B)
 	brightness := (fr + fg + fb) / 3
 	maxC := fr
 	if fg > maxC {
@@ -865,7 +879,7 @@ func isDarkFillerTexture(m *bmd.Mesh, texResolver texture.Resolver) bool {
 	if texResolver == nil {
 		return false
 	}
-	tex := texResolver.Resolve(m.TexPath)
+	tex, avg := texResolver.ResolveAverage(m.TexPath)
 	if tex == nil {
 		return false
 	}
@@ -873,8 +887,7 @@ func isDarkFillerTexture(m *bmd.Mesh, texResolver texture.Resolver) bool {
 	if b.Dx() > 16 || b.Dy() > 16 {
 		return false
 	}
-	r, g, bl, _ := averageColor(tex)
-	brightness := (float64(r) + float64(g) + float64(bl)) / 3
+	brightness := (float64(avg.R) + float64(avg.G) + float64(avg.B)) / 3
 	return brightness < 10
 }
 
@@ -1193,26 +1206,3 @@ func applyTint(src *image.NRGBA, tint [3]float64) *image.NRGBA {
 	}
 	return dst
 }
-
-func averageColor(tex *image.NRGBA) (uint8, uint8, uint8, uint8) {
-	b := tex.Bounds()
-	w, h := b.Dx(), b.Dy()
-	if w == 0 || h == 0 {
-		return 160, 160, 170, 255
-	}
-
-	var sumR, sumG, sumB float64
-	total := w * h
-	stride := tex.Stride
-	for y := 0; y < h; y++ {
-		off := y * stride
-		for x := 0; x < w; x++ {
-			i := off + x*4
-			sumR += float64(tex.Pix[i])
-			sumG += float64(tex.Pix[i+1])
-			sumB += float64(tex.Pix[i+2])
-		}
-	}
-	n := float64(total)
-	return uint8(sumR/n + 0.5), uint8(sumG/n + 0.5), uint8(sumB/n + 0.5), 255
-}
@@ -5,9 +5,34 @@ import "image"
 // SampleTexture performs bilinear filtering with UV wrapping.
 // Returns RGBA as uint8. Accesses tex.Pix directly for performance.
 func SampleTexture(tex *image.NRGBA, u, v float64) (r, g, b, a uint8) {
+	s := newTexSampler(tex)
+	return s.sample(u, v)
+}
+
+// texSampler holds the per-texture constants of SampleTexture so the
+// rasterizers set them up once per triangle rather than once per pixel.
+type texSampler struct {
+	pix    []uint8
+	stride int
+	w, h   int
+	fw, fh float64
+}
+
+func newTexSampler(tex *image.NRGBA) texSampler {
 	w := tex.Rect.Dx()
 	h := tex.Rect.Dy()
+	return texSampler{
+		pix:    tex.Pix,
+		stride: tex.Stride,
+		w:      w,
+		h:      h,
+		fw:     float64(w - 1),
+		fh:     float64(h - 1),
+	}
+}
 
+// sample is SampleTexture against the prepared texture.
+func (s *texSampler) sample(u, v float64) (r, g, b, a uint8) {
 	// Wrap UVs
 	u = u - float64(int(u))
 	if u < 0 {
@@ -18,33 +43,53 @@ func SampleTexture(tex *image.NRGBA, u, v float64) (r, g, b, a uint8) {
 		v += 1.0
 	}
 
-	fx := u * float64(w-1)
-	fy := v * float64(h-1)
+	fx := u * s.fw
+	fy := v * s.fh
 	x0 := int(fx)
 	y0 := int(fy)
-	x1 := (x0 + 1) % w
-	y1 := (y0 + 1) % h
-	dx := fx - float64(x0)
-	dy := fy - float64(y0)
+	// x0 and y0 are at most w-1 and h-1, so wrapping the neighbour
+	// needs a compare, not a modulo.
+	x1 := x0 + 1
+	if x1 >= s.w {
+		x1 = 0
+	}
+	y1 := y0 + 1
+	if y1 >= s.h {
+		y1 = 0
+	}
+	// Bilinear weights in 16.16 fixed point: with 64-bit integers the blend
+	// needs no per-texel float conversions. Quantising dx and dy to 1/65536
+	// can move a result across the rounding boundary, so a channel may
+	// differ by ±1 from the float blend (about 0.04% of samples). Where that
+	// carries a texel across a rasterizer cutoff (the ca < 8 transparency
+	// skip, or the additive pass's darkFloor luminance test), the whole
+	// contribution of that pixel turns on or off, so single output bytes
+	// can change by far more than 1.
+	dx := uint64((fx-float64(x0))*65536 + 0.5)
+	dy := uint64((fy-float64(y0))*65536 + 0.5)
 
-	stride := tex.Stride
-	pix := tex.Pix
+	stride := s.stride
+	pix := s.pix
 
 	// Four texels
 	i00 := y0*stride + x0*4
 	i10 := y0*stride + x1*4
 	i01 := y1*stride + x0*4
 	i11 := y1*stride + x1*4
+	t00 := pix[i00 : i00+4 : i00+4]
+	t10 := pix[i10 : i10+4 : i10+4]
+	t01 := pix[i01 : i01+4 : i01+4]
+	t11 := pix[i11 : i11+4 : i11+4]
 
-	w00 := (1 - dx) * (1 - dy)
-	w10 := dx * (1 - dy)
-	w01 := (1 - dx) * dy
+	w00 := (65536 - dx) * (65536 - dy)
+	w10 := dx * (65536 - dy)
+	w01 := (65536 - dx) * dy
 	w11 := dx * dy
 
-	fr := float64(pix[i00])*w00 + float64(pix[i10])*w10 + float64(pix[i01])*w01 + float64(pix[i11])*w11
-	fg := float64(pix[i00+1])*w00 + float64(pix[i10+1])*w10 + float64(pix[i01+1])*w01 + float64(pix[i11+1])*w11
-	fb := float64(pix[i00+2])*w00 + float64(pix[i10+2])*w10 + float64(pix[i01+2])*w01 + float64(pix[i11+2])*w11
-	fa := float64(pix[i00+3])*w00 + float64(pix[i10+3])*w10 + float64(pix[i01+3])*w01 + float64(pix[i11+3])*w11
-
-	return uint8(fr + 0.5), uint8(fg + 0.5), uint8(fb + 0.5), uint8(fa + 0.5)
+	const half = 1 << 31
+	r = uint8((uint64(t00[0])*w00 + uint64(t10[0])*w10 + uint64(t01[0])*w01 + uint64(t11[0])*w11 + half) >> 32)
+	g = uint8((uint64(t00[1])*w00 + uint64(t10[1])*w10 + uint64(t01[1])*w01 + uint64(t11[1])*w11 + half) >> 32)
+	b = uint8((uint64(t00[2])*w00 + uint64(t10[2])*w10 + uint64(t01[2])*w01 + uint64(t11[2])*w11 + half) >> 32)
+	a = uint8((uint64(t00[3])*w00 + uint64(t10[3])*w10 + uint64(t01[3])*w01 + uint64(t11[3])*w11 + half) >> 32)
+	return r, g, b, a
 }
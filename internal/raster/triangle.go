@@ -37,6 +37,34 @@ func conservativeThresholds(x0, y0, x1, y1, x2, y2, det float64) (float64, float
 	return t0, t1, t2
 }
 
+// clipSpan narrows the pixel range [lo, hi] of a row to where the weight
+// a*(sx-x2) + c can reach t. The bound keeps a one-pixel margin, so the
+// exact per-pixel test still decides every pixel it lets through; near-zero
+// slopes leave the range untouched. An empty span is returned as hi < lo.
+func clipSpan(lo, hi int, a, c, t, x2 float64) (int, int) {
+	const minSlope = 1e-9
+	if a > -minSlope && a < minSlope {
+		return lo, hi
+	}
+	b := x2 + (t-c)/a
+	if a > 0 {
+		if b > float64(hi)+1 {
+			return lo, lo - 1
+		}
+		if b > float64(lo)+1 {
+			lo = int(b) - 1
+		}
+	} else {
+		if b < float64(lo)-1 {
+			return lo, lo - 1
+		}
+		if b < float64(hi)-1 {
+			hi = int(math.Ceil(b)) + 1
+		}
+	}
+	return lo, hi
+}
+
 // RasterizeTriangle rasterizes a single triangle with texture mapping, z-buffer,
 // sRGB color space, lighting, and ACES tone mapping.
 //
@@ -78,46 +106,22 @@ func RasterizeTriangle(
 	}
 
 	var u0, v0uv, u1, v1uv, u2, v2uv float64
+	var ts texSampler
 	if hasUV {
+		ts = newTexSampler(tex)
 		u0, v0uv = float64(uvs[uvIdx[0]][0]), float64(uvs[uvIdx[0]][1])
 		u1, v1uv = float64(uvs[uvIdx[1]][0]), float64(uvs[uvIdx[1]][1])
 		u2, v2uv = float64(uvs[uvIdx[2]][0]), float64(uvs[uvIdx[2]][1])
 	}
 
-	// Face normal for flat shading
-	e1x, e1y, e1z := x1-x0, y1-y0, z1-z0
-	e2x, e2y, e2z := x2-x0, y2-y0, z2-z0
-	nx := e1y*e2z - e1z*e2y
-	ny := e1z*e2x - e1x*e2z
-	nz := e1x*e2y - e1y*e2x
-	nl := math.Sqrt(nx*nx + ny*ny + nz*nz)
-	if nl < 1e-8 {
-		return
-	}
-	invNL := 1.0 / nl
-	nx *= invNL
-	ny *= invNL
-	nz *= invNL
-
-	// Compute shade using lighting config
-	ndlMain := math.Abs(nx*lc.LightDir[0] + ny*lc.LightDir[1] + nz*lc.LightDir[2])
-	ndlRim := math.Abs(nx*lc.RimDir[0] + ny*lc.RimDir[1] + nz*lc.RimDir[2])
-	hemi := (1.0-math.Abs(ny))*0.5 + 0.5
-	hemiLight := hemi * lc.Hemi
-	ndh := nx*lc.HalfMain[0] + ny*lc.HalfMain[1] + nz*lc.HalfMain[2]
-	if ndh < 0 {
-		ndh = 0
-	}
-	spec := math.Pow(ndh, lc.SpecPow) * lc.SpecInt
-	shade := lc.Ambient + hemiLight + ndlMain*lc.Direct + ndlRim*lc.Rim + spec
-
-	// Bounding box
+	// Bounding box. The min/max builtins compile to inline compares and
+	// match math.Min/Max, NaN and signed zero included.
 	w := fb.Width
 	h := fb.Height
-	minX := int(math.Min(math.Min(x0, x1), x2))
-	maxX := int(math.Max(math.Max(x0, x1), x2)) + 1
-	minY := int(math.Min(math.Min(y0, y1), y2))
-	maxY := int(math.Max(math.Max(y0, y1), y2)) + 1
+	minX := int(min(x0, x1, x2))
+	maxX := int(max(x0, x1, x2)) + 1
+	minY := int(min(y0, y1, y2))
+	maxY := int(max(y0, y1, y2)) + 1
 
 	if minX < 0 {
 		minX = 0
@@ -142,6 +146,34 @@ func RasterizeTriangle(
 	}
 	invDet := 1.0 / det
 
+	// Face normal for flat shading. Lighting runs only for triangles that
+	// survive the screen bbox and area checks above.
+	e1x, e1y, e1z := x1-x0, y1-y0, z1-z0
+	e2x, e2y, e2z := x2-x0, y2-y0, z2-z0
+	nx := e1y*e2z - e1z*e2y
+	ny := e1z*e2x - e1x*e2z
+	nz := e1x*e2y - e1y*e2x
+	nl := math.Sqrt(nx*nx + ny*ny + nz*nz)
+	if nl < 1e-8 {
+		return
+	}
+	invNL := 1.0 / nl
+	nx *= invNL
+	ny *= invNL
+	nz *= invNL
+
+	// Compute shade using lighting config
+	ndlMain := math.Abs(nx*lc.LightDir[0] + ny*lc.LightDir[1] + nz*lc.LightDir[2])
+	ndlRim := math.Abs(nx*lc.RimDir[0] + ny*lc.RimDir[1] + nz*lc.RimDir[2])
+	hemi := (1.0-math.Abs(ny))*0.5 + 0.5
+	hemiLight := hemi * lc.Hemi
+	ndh := nx*lc.HalfMain[0] + ny*lc.HalfMain[1] + nz*lc.HalfMain[2]
+	if ndh < 0 {
+		ndh = 0
+	}
+	spec := math.Pow(ndh, lc.SpecPow) * lc.SpecInt
+	shade := lc.Ambient + hemiLight + ndlMain*lc.Direct + ndlRim*lc.Rim + spec
+
 	// Precompute edge deltas
 	dy12 := y1 - y2
 	dx21 := x2 - x1
@@ -153,24 +185,47 @@ func RasterizeTriangle(
 
 	exposure := lc.Exposure
 	invGamma := lc.InvGamma
+	shadeExp := shade * exposure
+	zbuf, color := fb.ZBuf, fb.Color
+
+	// Large triangles shade through a per-triangle table: with flat
+	// shading the result depends only on the 8-bit channel value.
+	var lut *shadeLUT
+	useLUT := (maxX-minX+1)*(maxY-minY+1) >= shadeLUTMinArea
+	if useLUT {
+		lut = new(shadeLUT)
+		lut.build(shadeExp, invGamma)
+	}
+
+	// Barycentric weights are affine in the pixel position: w = a*dsx + c,
+	// with c fixed per row, so each pixel costs one multiply-add per weight.
+	// Each row is first narrowed to the span the three edges can pass.
+	a0 := dy12 * invDet
+	a1 := dy20 * invDet
+	a2 := -(a0 + a1)
 
 	// Pixel loop — zero allocations
 	for sy := minY; sy <= maxY; sy++ {
 		dsy := float64(sy) - y2
+		c0 := dx21 * dsy * invDet
+		c1 := dx02 * dsy * invDet
 		rowOff := sy * w
-		for sx := minX; sx <= maxX; sx++ {
+		lo, hi := clipSpan(minX, maxX, a0, c0, thresh0, x2)
+		lo, hi = clipSpan(lo, hi, a1, c1, thresh1, x2)
+		lo, hi = clipSpan(lo, hi, a2, 1.0-c0-c1, thresh2, x2)
+		for sx := lo; sx <= hi; sx++ {
 			dsx := float64(sx) - x2
-			w0 := (dy12*dsx + dx21*dsy) * invDet
-			w1 := (dy20*dsx + dx02*dsy) * invDet
+			w0 := a0*dsx + c0
+			w1 := a1*dsx + c1
 			w2 := 1.0 - w0 - w1
 
 			if w0 < thresh0 || w1 < thresh1 || w2 < thresh2 {
 				continue
 			}
 
-			z := w0*z0 + w1*z1 + w2*z2
+			z := float32(w0*z0 + w1*z1 + w2*z2)
 			zIdx := rowOff + sx
-			if z < fb.ZBuf[zIdx] {
+			if z < zbuf[zIdx] {
 				continue
 			}
 
@@ -178,7 +233,7 @@ func RasterizeTriangle(
 			if hasUV {
 				u := w0*u0 + w1*u1 + w2*u2
 				v := w0*v0uv + w1*v1uv + w2*v2uv
-				cr, cg, cb, ca = SampleTexture(tex, u, v)
+				cr, cg, cb, ca = ts.sample(u, v)
 			} else {
 				cr, cg, cb, ca = defaultR, defaultG, defaultB, defaultA
 			}
@@ -187,32 +242,23 @@ func RasterizeTriangle(
 			if ca < 8 {
 				continue
 			}
-			fb.ZBuf[zIdx] = z
-
-			// sRGB decode → linear (LUT)
-			lr := srgbToLinear[cr]
-			lg := srgbToLinear[cg]
-			lb := srgbToLinear[cb]
-
-			// Apply shading + ACES tone mapping
-			sr := lr * shade * exposure
-			sg := lg * shade * exposure
-			sb := lb * shade * exposure
+			zbuf[zIdx] = z
 
-			tr := ACESTonemap(sr)
-			tg := ACESTonemap(sg)
-			tb := ACESTonemap(sb)
-
-			// Linear → sRGB encode
-			fr := math.Pow(tr, invGamma)
-			fg := math.Pow(tg, invGamma)
-			ffb := math.Pow(tb, invGamma)
+			// sRGB decode → shade → ACES → sRGB encode, scaled to 0..255
+			var fr, fg, ffb float64
+			if useLUT {
+				fr, fg, ffb = lut[cr], lut[cg], lut[cb]
+			} else {
+				fr = encodeGamma(ACESTonemap(srgbToLinear[cr]*shadeExp), invGamma) * 255
+				fg = encodeGamma(ACESTonemap(srgbToLinear[cg]*shadeExp), invGamma) * 255
+				ffb = encodeGamma(ACESTonemap(srgbToLinear[cb]*shadeExp), invGamma) * 255
+			}
 
 			pxIdx := zIdx * 4
-			fb.Color[pxIdx] = clamp255(fr * 255)
-			fb.Color[pxIdx+1] = clamp255(fg * 255)
-			fb.Color[pxIdx+2] = clamp255(ffb * 255)
-			fb.Color[pxIdx+3] = ca
+			color[pxIdx] = clamp255(fr)
+			color[pxIdx+1] = clamp255(fg)
+			color[pxIdx+2] = clamp255(ffb)
+			color[pxIdx+3] = ca
 		}
 	}
 }
@@ -253,12 +299,43 @@ func RasterizeTriangleAdditive(
 	}
 
 	var u0, v0uv, u1, v1uv, u2, v2uv float64
+	var ts texSampler
 	if hasUV {
+		ts = newTexSampler(tex)
 		u0, v0uv = float64(uvs[uvIdx[0]][0]), float64(uvs[uvIdx[0]][1])
 		u1, v1uv = float64(uvs[uvIdx[1]][0]), float64(uvs[uvIdx[1]][1])
 		u2, v2uv = float64(uvs[uvIdx[2]][0]), float64(uvs[uvIdx[2]][1])
 	}
 
+	w := fb.Width
+	h := fb.Height
+	minX := int(min(x0, x1, x2))
+	maxX := int(max(x0, x1, x2)) + 1
+	minY := int(min(y0, y1, y2))
+	maxY := int(max(y0, y1, y2)) + 1
+
+	if minX < 0 {
+		minX = 0
+	}
+	if maxX >= w {
+		maxX = w - 1
+	}
+	if minY < 0 {
+		minY = 0
+	}
+	if maxY >= h {
+		maxY = h - 1
+	}
+	if minX >= maxX || minY >= maxY {
+		return
+	}
+
+	det := (y1-y2)*(x0-x2) + (x2-x1)*(y0-y2)
+	if det > -1e-8 && det < 1e-8 {
+		return
+	}
+	invDet := 1.0 / det
+
 	// Flat shading
 	e1x, e1y, e1z := x1-x0, y1-y0, pz[idx[1]]-pz[idx[0]]
 	e2x, e2y, e2z := x2-x0, y2-y0, pz[idx[2]]-pz[idx[0]]
@@ -285,35 +362,6 @@ func RasterizeTriangleAdditive(
 	spec := math.Pow(ndh, lc.SpecPow) * lc.SpecInt
 	shade := lc.Ambient + hemiLight + ndlMain*lc.Direct + ndlRim*lc.Rim + spec
 
-	w := fb.Width
-	h := fb.Height
-	minX := int(math.Min(math.Min(x0, x1), x2))
-	maxX := int(math.Max(math.Max(x0, x1), x2)) + 1
-	minY := int(math.Min(math.Min(y0, y1), y2))
-	maxY := int(math.Max(math.Max(y0, y1), y2)) + 1
-
-	if minX < 0 {
-		minX = 0
-	}
-	if maxX >= w {
-		maxX = w - 1
-	}
-	if minY < 0 {
-		minY = 0
-	}
-	if maxY >= h {
-		maxY = h - 1
-	}
-	if minX >= maxX || minY >= maxY {
-		return
-	}
-
-	det := (y1-y2)*(x0-x2) + (x2-x1)*(y0-y2)
-	if det > -1e-8 && det < 1e-8 {
-		return
-	}
-	invDet := 1.0 / det
-
 	dy12 := y1 - y2
 	dx21 := x2 - x1
 	dy20 := y2 - y0
@@ -323,14 +371,37 @@ func RasterizeTriangleAdditive(
 
 	exposure := lc.Exposure
 	invGamma := lc.InvGamma
-
+	shadeExp := shade * exposure
+	zbuf, color := fb.ZBuf, fb.Color
+	darkFloor := lc.AdditiveDarkFloor
+
+	// Large triangles shade through a per-triangle table: with flat
+	// shading the result depends only on the 8-bit channel value.
+	var lut *shadeLUT
+	useLUT := (maxX-minX+1)*(maxY-minY+1) >= shadeLUTMinArea
+	if useLUT {
+		lut = new(shadeLUT)
+		lut.build(shadeExp, invGamma)
+	}
+
+	// Barycentric weights are affine in the pixel position: w = a*dsx + c,
+	// with c fixed per row, so each pixel costs one multiply-add per weight.
+	// Each row is first narrowed to the span the three edges can pass.
+	a0 := dy12 * invDet
+	a1 := dy20 * invDet
+	a2 := -(a0 + a1)
 	for sy := minY; sy <= maxY; sy++ {
 		dsy := float64(sy) - y2
+		c0 := dx21 * dsy * invDet
+		c1 := dx02 * dsy * invDet
 		rowOff := sy * w
-		for sx := minX; sx <= maxX; sx++ {
+		lo, hi := clipSpan(minX, maxX, a0, c0, at0, x2)
+		lo, hi = clipSpan(lo, hi, a1, c1, at1, x2)
+		lo, hi = clipSpan(lo, hi, a2, 1.0-c0-c1, at2, x2)
+		for sx := lo; sx <= hi; sx++ {
 			dsx := float64(sx) - x2
-			w0 := (dy12*dsx + dx21*dsy) * invDet
-			w1 := (dy20*dsx + dx02*dsy) * invDet
+			w0 := a0*dsx + c0
+			w1 := a1*dsx + c1
 			w2 := 1.0 - w0 - w1
 
 			if w0 < at0 || w1 < at1 || w2 < at2 {
@@ -341,7 +412,7 @@ func RasterizeTriangleAdditive(
 			if hasUV {
 				u := w0*u0 + w1*u1 + w2*u2
 				v := w0*v0uv + w1*v1uv + w2*v2uv
-				cr, cg, cb, ca = SampleTexture(tex, u, v)
+				cr, cg, cb, ca = ts.sample(u, v)
 			} else {
 				cr, cg, cb, ca = defaultR, defaultG, defaultB, defaultA
 			}
@@ -357,42 +428,36 @@ func RasterizeTriangleAdditive(
 			// to pass the test despite floating point imprecision.
 			z := w0*z0 + w1*z1 + w2*z2
 			zbIdx := rowOff + sx
-			if z < fb.ZBuf[zbIdx]-0.5 {
+			if z < float64(zbuf[zbIdx])-0.5 {
 				continue
 			}
 
-			lr := srgbToLinear[cr]
-			lg := srgbToLinear[cg]
-			lb := srgbToLinear[cb]
-
-			sr := lr * shade * exposure
-			sg := lg * shade * exposure
-			sb := lb * shade * exposure
-
-			tr := ACESTonemap(sr)
-			tg := ACESTonemap(sg)
-			tb := ACESTonemap(sb)
-
-			fr := math.Pow(tr, invGamma) * 255
-			fg := math.Pow(tg, invGamma) * 255
-			ffb := math.Pow(tb, invGamma) * 255
+			// sRGB decode → shade → ACES → sRGB encode, scaled to 0..255
+			var fr, fg, ffb float64
+			if useLUT {
+				fr, fg, ffb = lut[cr], lut[cg], lut[cb]
+			} else {
+				fr = encodeGamma(ACESTonemap(srgbToLinear[cr]*shadeExp), invGamma) * 255
+				fg = encodeGamma(ACESTonemap(srgbToLinear[cg]*shadeExp), invGamma) * 255
+				ffb = encodeGamma(ACESTonemap(srgbToLinear[cb]*shadeExp), invGamma) * 255
+			}
 
 			// Skip very dark texels — dark fire/energy background should not
 			// brighten existing pixels. Only bright glow/energy parts contribute.
 			lum := fr*0.299 + fg*0.587 + ffb*0.114
-			if lum < lc.AdditiveDarkFloor {
+			if lum < darkFloor {
 				continue
 			}
 
 			pxIdx := (rowOff + sx) * 4
 			// Additive: add to existing pixel, clamp to 255
-			fb.Color[pxIdx] = clamp255(float64(fb.Color[pxIdx]) + fr)
-			fb.Color[pxIdx+1] = clamp255(float64(fb.Color[pxIdx+1]) + fg)
-			fb.Color[pxIdx+2] = clamp255(float64(fb.Color[pxIdx+2]) + ffb)
+			color[pxIdx] = clamp255(float64(color[pxIdx]) + fr)
+			color[pxIdx+1] = clamp255(float64(color[pxIdx+1]) + fg)
+			color[pxIdx+2] = clamp255(float64(color[pxIdx+2]) + ffb)
 			// Alpha: use brightness of added color (dark pixels stay transparent)
 			addAlpha := clamp255(lum)
-			if addAlpha > fb.Color[pxIdx+3] {
-				fb.Color[pxIdx+3] = addAlpha
+			if addAlpha > color[pxIdx+3] {
+				color[pxIdx+3] = addAlpha
 			}
 		}
 	}
@@ -434,43 +499,20 @@ func RasterizeTriangleAdditiveOverlay(
 	}
 
 	var u0, v0uv, u1, v1uv, u2, v2uv float64
+	var ts texSampler
 	if hasUV {
+		ts = newTexSampler(tex)
 		u0, v0uv = float64(uvs[uvIdx[0]][0]), float64(uvs[uvIdx[0]][1])
 		u1, v1uv = float64(uvs[uvIdx[1]][0]), float64(uvs[uvIdx[1]][1])
 		u2, v2uv = float64(uvs[uvIdx[2]][0]), float64(uvs[uvIdx[2]][1])
 	}
 
-	e1x, e1y, e1z := x1-x0, y1-y0, z1-z0
-	e2x, e2y, e2z := x2-x0, y2-y0, z2-z0
-	nx := e1y*e2z - e1z*e2y
-	ny := e1z*e2x - e1x*e2z
-	nz := e1x*e2y - e1y*e2x
-	nl := math.Sqrt(nx*nx + ny*ny + nz*nz)
-	if nl < 1e-8 {
-		return
-	}
-	invNL := 1.0 / nl
-	nx *= invNL
-	ny *= invNL
-	nz *= invNL
-
-	ndlMain := math.Abs(nx*lc.LightDir[0] + ny*lc.LightDir[1] + nz*lc.LightDir[2])
-	ndlRim := math.Abs(nx*lc.RimDir[0] + ny*lc.RimDir[1] + nz*lc.RimDir[2])
-	hemi := (1.0-math.Abs(ny))*0.5 + 0.5
-	hemiLight := hemi * lc.Hemi
-	ndh := nx*lc.HalfMain[0] + ny*lc.HalfMain[1] + nz*lc.HalfMain[2]
-	if ndh < 0 {
-		ndh = 0
-	}
-	spec := math.Pow(ndh, lc.SpecPow) * lc.SpecInt
-	shade := lc.Ambient + hemiLight + ndlMain*lc.Direct + ndlRim*lc.Rim + spec
-
 	w := fb.Width
 	h := fb.Height
-	minX := int(math.Min(math.Min(x0, x1), x2))
-	maxX := int(math.Max(math.Max(x0, x1), x2)) + 1
-	minY := int(math.Min(math.Min(y0, y1), y2))
-	maxY := int(math.Max(math.Max(y0, y1), y2)) + 1
+	minX := int(min(x0, x1, x2))
+	maxX := int(max(x0, x1, x2)) + 1
+	minY := int(min(y0, y1, y2))
+	maxY := int(max(y0, y1, y2)) + 1
 
 	if minX < 0 {
 		minX = 0
@@ -494,6 +536,31 @@ func RasterizeTriangleAdditiveOverlay(
 	}
 	invDet := 1.0 / det
 
+	e1x, e1y, e1z := x1-x0, y1-y0, z1-z0
+	e2x, e2y, e2z := x2-x0, y2-y0, z2-z0
+	nx := e1y*e2z - e1z*e2y
+	ny := e1z*e2x - e1x*e2z
+	nz := e1x*e2y - e1y*e2x
+	nl := math.Sqrt(nx*nx + ny*ny + nz*nz)
+	if nl < 1e-8 {
+		return
+	}
+	invNL := 1.0 / nl
+	nx *= invNL
+	ny *= invNL
+	nz *= invNL
+
+	ndlMain := math.Abs(nx*lc.LightDir[0] + ny*lc.LightDir[1] + nz*lc.LightDir[2])
+	ndlRim := math.Abs(nx*lc.RimDir[0] + ny*lc.RimDir[1] + nz*lc.RimDir[2])
+	hemi := (1.0-math.Abs(ny))*0.5 + 0.5
+	hemiLight := hemi * lc.Hemi
+	ndh := nx*lc.HalfMain[0] + ny*lc.HalfMain[1] + nz*lc.HalfMain[2]
+	if ndh < 0 {
+		ndh = 0
+	}
+	spec := math.Pow(ndh, lc.SpecPow) * lc.SpecInt
+	shade := lc.Ambient + hemiLight + ndlMain*lc.Direct + ndlRim*lc.Rim + spec
+
 	dy12 := y1 - y2
 	dx21 := x2 - x1
 	dy20 := y2 - y0
@@ -503,14 +570,37 @@ func RasterizeTriangleAdditiveOverlay(
 
 	exposure := lc.Exposure
 	invGamma := lc.InvGamma
-
+	shadeExp := shade * exposure
+	zbuf, color := fb.ZBuf, fb.Color
+	darkFloor := lc.AdditiveDarkFloor
+
+	// Large triangles shade through a per-triangle table: with flat
+	// shading the result depends only on the 8-bit channel value.
+	var lut *shadeLUT
+	useLUT := (maxX-minX+1)*(maxY-minY+1) >= shadeLUTMinArea
+	if useLUT {
+		lut = new(shadeLUT)
+		lut.build(shadeExp, invGamma)
+	}
+
+	// Barycentric weights are affine in the pixel position: w = a*dsx + c,
+	// with c fixed per row, so each pixel costs one multiply-add per weight.
+	// Each row is first narrowed to the span the three edges can pass.
+	a0 := dy12 * invDet
+	a1 := dy20 * invDet
+	a2 := -(a0 + a1)
 	for sy := minY; sy <= maxY; sy++ {
 		dsy := float64(sy) - y2
+		c0 := dx21 * dsy * invDet
+		c1 := dx02 * dsy * invDet
 		rowOff := sy * w
-		for sx := minX; sx <= maxX; sx++ {
+		lo, hi := clipSpan(minX, maxX, a0, c0, bt0, x2)
+		lo, hi = clipSpan(lo, hi, a1, c1, bt1, x2)
+		lo, hi = clipSpan(lo, hi, a2, 1.0-c0-c1, bt2, x2)
+		for sx := lo; sx <= hi; sx++ {
 			dsx := float64(sx) - x2
-			w0 := (dy12*dsx + dx21*dsy) * invDet
-			w1 := (dy20*dsx + dx02*dsy) * invDet
+			w0 := a0*dsx + c0
+			w1 := a1*dsx + c1
 			w2 := 1.0 - w0 - w1
 
 			if w0 < bt0 || w1 < bt1 || w2 < bt2 {
@@ -520,7 +610,7 @@ func RasterizeTriangleAdditiveOverlay(
 			zbIdx := rowOff + sx
 
 			// OVERLAY CHECK: skip pixels on empty background (no opaque geometry drawn)
-			if fb.ZBuf[zbIdx] == math.Inf(-1) {
+			if zbuf[zbIdx] == zEmpty {
 				continue
 			}
 
@@ -528,7 +618,7 @@ func RasterizeTriangleAdditiveOverlay(
 			if hasUV {
 				u := w0*u0 + w1*u1 + w2*u2
 				v := w0*v0uv + w1*v1uv + w2*v2uv
-				cr, cg, cb, ca = SampleTexture(tex, u, v)
+				cr, cg, cb, ca = ts.sample(u, v)
 			} else {
 				cr, cg, cb, ca = defaultR, defaultG, defaultB, defaultA
 			}
@@ -538,38 +628,32 @@ func RasterizeTriangleAdditiveOverlay(
 			}
 
 			z := w0*z0 + w1*z1 + w2*z2
-			if z < fb.ZBuf[zbIdx]-0.5 {
+			if z < float64(zbuf[zbIdx])-0.5 {
 				continue
 			}
 
-			lr := srgbToLinear[cr]
-			lg := srgbToLinear[cg]
-			lb := srgbToLinear[cb]
-
-			sr := lr * shade * exposure
-			sg := lg * shade * exposure
-			sb := lb * shade * exposure
-
-			tr := ACESTonemap(sr)
-			tg := ACESTonemap(sg)
-			tb := ACESTonemap(sb)
-
-			fr := math.Pow(tr, invGamma) * 255
-			fg := math.Pow(tg, invGamma) * 255
-			ffb := math.Pow(tb, invGamma) * 255
+			// sRGB decode → shade → ACES → sRGB encode, scaled to 0..255
+			var fr, fg, ffb float64
+			if useLUT {
+				fr, fg, ffb = lut[cr], lut[cg], lut[cb]
+			} else {
+				fr = encodeGamma(ACESTonemap(srgbToLinear[cr]*shadeExp), invGamma) * 255
+				fg = encodeGamma(ACESTonemap(srgbToLinear[cg]*shadeExp), invGamma) * 255
+				ffb = encodeGamma(ACESTonemap(srgbToLinear[cb]*shadeExp), invGamma) * 255
+			}
 
 			lum := fr*0.299 + fg*0.587 + ffb*0.114
-			if lum < lc.AdditiveDarkFloor {
+			if lum < darkFloor {
 				continue
 			}
 
 			pxIdx := (rowOff + sx) * 4
-			fb.Color[pxIdx] = clamp255(float64(fb.Color[pxIdx]) + fr)
-			fb.Color[pxIdx+1] = clamp255(float64(fb.Color[pxIdx+1]) + fg)
-			fb.Color[pxIdx+2] = clamp255(float64(fb.Color[pxIdx+2]) + ffb)
+			color[pxIdx] = clamp255(float64(color[pxIdx]) + fr)
+			color[pxIdx+1] = clamp255(float64(color[pxIdx+1]) + fg)
+			color[pxIdx+2] = clamp255(float64(color[pxIdx+2]) + ffb)
 			addAlpha := clamp255(lum)
-			if addAlpha > fb.Color[pxIdx+3] {
-				fb.Color[pxIdx+3] = addAlpha
+			if addAlpha > color[pxIdx+3] {
+				color[pxIdx+3] = addAlpha
 			}
 		}
 	}
@@ -611,12 +695,34 @@ func RasterizeTriangleAlphaBlend(
 	}
 
 	var u0, v0uv, u1, v1uv, u2, v2uv float64
+	var ts texSampler
 	if hasUV {
+		ts = newTexSampler(tex)
 		u0, v0uv = float64(uvs[uvIdx[0]][0]), float64(uvs[uvIdx[0]][1])
 		u1, v1uv = float64(uvs[uvIdx[1]][0]), float64(uvs[uvIdx[1]][1])
 		u2, v2uv = float64(uvs[uvIdx[2]][0]), float64(uvs[uvIdx[2]][1])
 	}
 
+	w := fb.Width
+	h := fb.Height
+
+	minX := int(math.Floor(min(x0, x1, x2)))
+	maxX := int(math.Ceil(max(x0, x1, x2)))
+	minY := int(math.Floor(min(y0, y1, y2)))
+	maxY := int(math.Ceil(max(y0, y1, y2)))
+
+	if minX < 0 { minX = 0 }
+	if maxX >= w { maxX = w - 1 }
+	if minY < 0 { minY = 0 }
+	if maxY >= h { maxY = h - 1 }
+	if minX > maxX || minY > maxY { return }
+
+	dx21 := x2 - x1; dy12 := y1 - y2
+	dx02 := x0 - x2; dy20 := y2 - y0
+	det := dy12*dx02 - dx21*dy20
+	if math.Abs(det) < 1e-10 { return }
+	invDet := 1.0 / det
+
 	// Flat shading
 	e1x, e1y, e1z := x1-x0, y1-y0, z1-z0
 	e2x, e2y, e2z := x2-x0, y2-y0, z2-z0
@@ -632,35 +738,38 @@ func RasterizeTriangleAlphaBlend(
 	shade := lc.ComputeShade(mathutil.Vec3{nx, ny, nz})
 	exposure := lc.Exposure
 	invGamma := lc.InvGamma
-
-	w := fb.Width
-	h := fb.Height
-
-	minX := int(math.Floor(math.Min(x0, math.Min(x1, x2))))
-	maxX := int(math.Ceil(math.Max(x0, math.Max(x1, x2))))
-	minY := int(math.Floor(math.Min(y0, math.Min(y1, y2))))
-	maxY := int(math.Ceil(math.Max(y0, math.Max(y1, y2))))
-
-	if minX < 0 { minX = 0 }
-	if maxX >= w { maxX = w - 1 }
-	if minY < 0 { minY = 0 }
-	if maxY >= h { maxY = h - 1 }
-
-	dx21 := x2 - x1; dy12 := y1 - y2
-	dx02 := x0 - x2; dy20 := y2 - y0
-	det := dy12*dx02 - dx21*dy20
-	if math.Abs(det) < 1e-10 { return }
-	invDet := 1.0 / det
+	shadeExp := shade * exposure
+	zbuf, color := fb.ZBuf, fb.Color
 
 	ct0, ct1, ct2 := conservativeThresholds(x0, y0, x1, y1, x2, y2, det)
 
+	// Large triangles shade through a per-triangle table: with flat
+	// shading the result depends only on the 8-bit channel value.
+	var lut *shadeLUT
+	useLUT := (maxX-minX+1)*(maxY-minY+1) >= shadeLUTMinArea
+	if useLUT {
+		lut = new(shadeLUT)
+		lut.build(shadeExp, invGamma)
+	}
+
+	// Barycentric weights are affine in the pixel position: w = a*dsx + c,
+	// with c fixed per row, so each pixel costs one multiply-add per weight.
+	// Each row is first narrowed to the span the three edges can pass.
+	a0 := dy12 * invDet
+	a1 := dy20 * invDet
+	a2 := -(a0 + a1)
 	for sy := minY; sy <= maxY; sy++ {
 		dsy := float64(sy) - y2
+		c0 := dx21 * dsy * invDet
+		c1 := dx02 * dsy * invDet
 		rowOff := sy * w
-		for sx := minX; sx <= maxX; sx++ {
+		lo, hi := clipSpan(minX, maxX, a0, c0, ct0, x2)
+		lo, hi = clipSpan(lo, hi, a1, c1, ct1, x2)
+		lo, hi = clipSpan(lo, hi, a2, 1.0-c0-c1, ct2, x2)
+		for sx := lo; sx <= hi; sx++ {
 			dsx := float64(sx) - x2
-			w0 := (dy12*dsx + dx21*dsy) * invDet
-			w1 := (dy20*dsx + dx02*dsy) * invDet
+			w0 := a0*dsx + c0
+			w1 := a1*dsx + c1
 			w2 := 1.0 - w0 - w1
 
 			if w0 < ct0 || w1 < ct1 || w2 < ct2 {
@@ -670,9 +779,9 @@ func RasterizeTriangleAlphaBlend(
 			// Z-depth test (read only, no write).
 			// Render if pixel is at same depth or closer than opaque geometry.
 			// ZBuf uses larger-z = closer convention (init=-inf), so skip if behind.
-			z := w0*z0 + w1*z1 + w2*z2
+			z := float32(w0*z0 + w1*z1 + w2*z2)
 			zbIdx := rowOff + sx
-			if z < fb.ZBuf[zbIdx] {
+			if z < zbuf[zbIdx] {
 				continue
 			}
 
@@ -680,7 +789,7 @@ func RasterizeTriangleAlphaBlend(
 			if hasUV {
 				u := w0*u0 + w1*u1 + w2*u2
 				v := w0*v0uv + w1*v1uv + w2*v2uv
-				cr, cg, cb, ca = SampleTexture(tex, u, v)
+				cr, cg, cb, ca = ts.sample(u, v)
 			} else {
 				cr, cg, cb, ca = defaultR, defaultG, defaultB, defaultA
 			}
@@ -689,35 +798,29 @@ func RasterizeTriangleAlphaBlend(
 				continue
 			}
 
-			lr := srgbToLinear[cr]
-			lg := srgbToLinear[cg]
-			lb := srgbToLinear[cb]
-
-			sr := lr * shade * exposure
-			sg := lg * shade * exposure
-			sb := lb * shade * exposure
-
-			tr := ACESTonemap(sr)
-			tg := ACESTonemap(sg)
-			tb := ACESTonemap(sb)
-
-			srcR := math.Pow(tr, invGamma) * 255
-			srcG := math.Pow(tg, invGamma) * 255
-			srcB := math.Pow(tb, invGamma) * 255
+			// sRGB decode → shade → ACES → sRGB encode, scaled to 0..255
+			var srcR, srcG, srcB float64
+			if useLUT {
+				srcR, srcG, srcB = lut[cr], lut[cg], lut[cb]
+			} else {
+				srcR = encodeGamma(ACESTonemap(srgbToLinear[cr]*shadeExp), invGamma) * 255
+				srcG = encodeGamma(ACESTonemap(srgbToLinear[cg]*shadeExp), invGamma) * 255
+				srcB = encodeGamma(ACESTonemap(srgbToLinear[cb]*shadeExp), invGamma) * 255
+			}
 
 			// Alpha compositing: dst = src*a + dst*(1-a)
 			a := float64(ca) / 255.0
 			oneMinusA := 1.0 - a
 			pxIdx := (rowOff + sx) * 4
-			dstR := float64(fb.Color[pxIdx])
-			dstG := float64(fb.Color[pxIdx+1])
-			dstB := float64(fb.Color[pxIdx+2])
-			dstA := float64(fb.Color[pxIdx+3])
-
-			fb.Color[pxIdx] = clamp255(srcR*a + dstR*oneMinusA)
-			fb.Color[pxIdx+1] = clamp255(srcG*a + dstG*oneMinusA)
-			fb.Color[pxIdx+2] = clamp255(srcB*a + dstB*oneMinusA)
-			fb.Color[pxIdx+3] = clamp255(float64(ca) + dstA*oneMinusA)
+			dstR := float64(color[pxIdx])
+			dstG := float64(color[pxIdx+1])
+			dstB := float64(color[pxIdx+2])
+			dstA := float64(color[pxIdx+3])
+
+			color[pxIdx] = clamp255(srcR*a + dstR*oneMinusA)
+			color[pxIdx+1] = clamp255(srcG*a + dstG*oneMinusA)
+			color[pxIdx+2] = clamp255(srcB*a + dstB*oneMinusA)
+			color[pxIdx+3] = clamp255(float64(ca) + dstA*oneMinusA)
 		}
 	}
 }
@@ -0,0 +1,74 @@
+package raster
+
+import (
+	"math/rand"
+	"testing"
+)
+
+// checkClipSpan walks every row of the triangle's bounding box the way the
+// rasterizers do and fails if a pixel that passes the per-pixel weight test
+// lies outside the span clipSpan keeps for that row.
+func checkClipSpan(t *testing.T, x0, y0, x1, y1, x2, y2 float64) {
+	t.Helper()
+	minX, maxX := int(min(x0, x1, x2)), int(max(x0, x1, x2))+1
+	minY, maxY := int(min(y0, y1, y2)), int(max(y0, y1, y2))+1
+	det := (y1-y2)*(x0-x2) + (x2-x1)*(y0-y2)
+	if det > -1e-8 && det < 1e-8 {
+		return
+	}
+	invDet := 1.0 / det
+	t0, t1, t2 := conservativeThresholds(x0, y0, x1, y1, x2, y2, det)
+	a0 := (y1 - y2) * invDet
+	a1 := (y2 - y0) * invDet
+	a2 := -(a0 + a1)
+	for sy := minY; sy <= maxY; sy++ {
+		dsy := float64(sy) - y2
+		c0 := (x2 - x1) * dsy * invDet
+		c1 := (x0 - x2) * dsy * invDet
+		lo, hi := clipSpan(minX, maxX, a0, c0, t0, x2)
+		lo, hi = clipSpan(lo, hi, a1, c1, t1, x2)
+		lo, hi = clipSpan(lo, hi, a2, 1.0-c0-c1, t2, x2)
+		for sx := minX; sx <= maxX; sx++ {
+			dsx := float64(sx) - x2
+			w0 := a0*dsx + c0
+			w1 := a1*dsx + c1
+			w2 := 1.0 - w0 - w1
+			if w0 < t0 || w1 < t1 || w2 < t2 {
+				continue
+			}
+			if sx < lo || sx > hi {
+				t.Fatalf("triangle (%g,%g) (%g,%g) (%g,%g): row %d pixel %d covered but span is [%d, %d]",
+					x0, y0, x1, y1, x2, y2, sy, sx, lo, hi)
+			}
+		}
+	}
+}
+
+func TestClipSpanKeepsCoveredPixels(t *testing.T) {
+	fixed := [][6]float64{
+		{0, 0, 200, 0.5, 100, 0.25},     // horizontal sliver
+		{0, 0, 0.5, 200, 0.25, 100},     // vertical sliver
+		{0, 0, 200, 200, 100, 100.001},  // diagonal, nearly collinear
+		{10.5, 10.5, 11, 11, 10.75, 12}, // sub-pixel
+		{0, 0, 300, 1e-6, 150, 1},       // edge slope near minSlope
+		{5, 5, 5.0001, 150, 5.0002, 3},  // hairline
+	}
+	for _, v := range fixed {
+		checkClipSpan(t, v[0], v[1], v[2], v[3], v[4], v[5])
+	}
+
+	rng := rand.New(rand.NewSource(1))
+	coord := func() float64 { return rng.Float64() * 256 }
+	for i := 0; i < 20000; i++ {
+		x0, y0, x1, y1 := coord(), coord(), coord(), coord()
+		// Put the third vertex near the segment x0y0-x1y1, at an offset
+		// ranging from a pixel down to far below one.
+		s := rng.Float64()
+		off := rng.Float64() * []float64{1, 1e-2, 1e-4, 1e-6}[i%4]
+		dx, dy := x1-x0, y1-y0
+		x2 := x0 + s*dx - dy*off
+		y2 := y0 + s*dy + dx*off
+		checkClipSpan(t, x0, y0, x1, y1, x2, y2)
+		checkClipSpan(t, x2, y2, x1, y1, x0, y0)
+	}
+}
@@ -11,9 +11,6 @@ import (
 // BMD-viewer's Three.js group inheritance (group.rotation.x = -PI/2).
 func BuildWorldMatrices(bones []bmd.Bone, boneFlip bool) []mathutil.Mat4 {
 	worlds := make([]mathutil.Mat4, len(bones))
-	for i := range worlds {
-		worlds[i] = mathutil.Mat4Identity()
-	}
 
 	// Rx(-90°) as Mat4 for root bone prefix
 	var rx90 mathutil.Mat4
@@ -23,6 +20,7 @@ func BuildWorldMatrices(bones []bmd.Bone, boneFlip bool) []mathutil.Mat4 {
 
 	for i, bone := range bones {
 		if bone.IsDummy {
+			worlds[i] = mathutil.Mat4Identity()
 			continue
 		}
 
@@ -32,13 +30,13 @@ func BuildWorldMatrices(bones []bmd.Bone, boneFlip bool) []mathutil.Mat4 {
 		pos := mathutil.Vec3{bone.BindPosition[0], bone.BindPosition[1], bone.BindPosition[2]}
 		local := mathutil.FromMat3Translation(rot, pos)
 
-		// Chain with parent
+		// Chain with parent (all bone transforms are affine)
 		if bone.Parent >= 0 && bone.Parent < i {
-			worlds[i] = mathutil.Mat4Mul(worlds[bone.Parent], local)
+			worlds[i] = mathutil.Mat4MulAffine(worlds[bone.Parent], local)
 		} else {
 			// Root bone
 			if boneFlip {
-				worlds[i] = mathutil.Mat4Mul(rx90, local)
+				worlds[i] = mathutil.Mat4MulAffine(rx90, local)
 			} else {
 				worlds[i] = local
 			}
@@ -57,12 +55,14 @@ func ApplyTransforms(meshes []bmd.Mesh, bones []bmd.Bone, boneFlip bool) {
 
 	worlds := BuildWorldMatrices(bones, boneFlip)
 
-	// Check if all matrices are identity (skip if so)
+	// Flag identity bones; their vertices stay put. Skip entirely if every
+	// bone is identity.
+	identity := make([]bool, len(worlds))
 	allIdentity := true
-	for _, w := range worlds {
-		if !w.IsIdentity() {
+	for i := range worlds {
+		identity[i] = worlds[i].IsIdentity()
+		if !identity[i] {
 			allIdentity = false
-			break
 		}
 	}
 	if allIdentity {
@@ -71,16 +71,13 @@ func ApplyTransforms(meshes []bmd.Mesh, bones []bmd.Bone, boneFlip bool) {
 
 	for mi := range meshes {
 		mesh := &meshes[mi]
-		for vi := range mesh.Verts {
-			boneIdx := int(mesh.Nodes[vi])
-			if boneIdx < 0 || boneIdx >= len(worlds) {
+		nodes := mesh.Nodes
+		for vi, p := range mesh.Verts {
+			boneIdx := int(nodes[vi])
+			if boneIdx < 0 || boneIdx >= len(worlds) || identity[boneIdx] {
 				continue
 			}
-			v := mathutil.Vec3{
-				float64(mesh.Verts[vi][0]),
-				float64(mesh.Verts[vi][1]),
-				float64(mesh.Verts[vi][2]),
-			}
+			v := mathutil.Vec3{float64(p[0]), float64(p[1]), float64(p[2])}
 			t := worlds[boneIdx].MulPoint(v)
 			mesh.Verts[vi] = [3]float32{float32(t[0]), float32(t[1]), float32(t[2])}
 		}
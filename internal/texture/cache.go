@@ -2,36 +2,74 @@ package texture
 
 import (
 	"image"
+	"image/color"
 	"sync"
 )
 
 // Resolver resolves a texture name to a decoded RGBA image.
 type Resolver interface {
 	Resolve(texName string) *image.NRGBA
+	// ResolveAverage is Resolve plus the texture's AverageColor, which is
+	// computed once per decoded texture rather than once per use.
+	ResolveAverage(texName string) (*image.NRGBA, color.NRGBA)
 }
 
-// Cache is a concurrency-safe texture cache.
+// maxCachedTextures bounds how many decoded textures a Cache holds. Items
+// are rendered in ItemList order, so textures shared between items are
+// reused soon after they are first loaded.
+const maxCachedTextures = 512
+
+// Cache is a concurrency-safe texture cache holding at most
+// maxCachedTextures entries. When full, the oldest entry is evicted
+// (first in, first out), which keeps cache hits on the read lock.
 type Cache struct {
 	mu    sync.RWMutex
 	items map[string]*cacheEntry
+	order []string // ring of cached paths in insertion order
+	next  int      // ring slot of the oldest entry, reused by the next insert
 	index *Index
 }
 
+// cacheEntry is created before its texture is decoded; once guards the
+// load so concurrent workers asking for the same texture decode it only
+// once and share the result (img may still be nil).
 type cacheEntry struct {
-	img    *image.NRGBA
-	loaded bool // true if we've attempted to load (img may still be nil)
+	once sync.Once
+	img  *image.NRGBA
+	avg  color.NRGBA
 }
 
 // NewCache creates a new texture cache backed by the given index.
 func NewCache(index *Index) *Cache {
 	return &Cache{
-		items: make(map[string]*cacheEntry),
+		items: make(map[string]*cacheEntry, maxCachedTextures),
+		order: make([]string, maxCachedTextures),
 		index: index,
 	}
 }
 
 // Resolve loads and caches a texture by name. Returns nil if not found.
 func (c *Cache) Resolve(texName string) *image.NRGBA {
+	entry := c.load(texName)
+	if entry == nil {
+		return nil
+	}
+	return entry.img
+}
+
+// ResolveAverage loads and caches a texture by name along with its
+// average color. Returns a nil image if not found.
+func (c *Cache) ResolveAverage(texName string) (*image.NRGBA, color.NRGBA) {
+	entry := c.load(texName)
+	if entry == nil {
+		return nil, color.NRGBA{}
+	}
+	return entry.img, entry.avg
+}
+
+// load returns the decoded cache entry for a texture name, or nil if the
+// name does not resolve to a file.
+func (c *Cache) load(texName string) *cacheEntry {
 	path, ok := c.index.ResolvePath(texName)
 	if !ok {
 		return nil
@@ -39,23 +77,30 @@ func (c *Cache) Resolve(texName string) *image.NRGBA {
 
 	// Fast path: read lock
 	c.mu.RLock()
-	if entry, exists := c.items[path]; exists {
-		c.mu.RUnlock()
-		return entry.img
-	}
+	entry, exists := c.items[path]
 	c.mu.RUnlock()
 
-	// Slow path: load from disk
-	img, _ := LoadTexture(path)
-
-	// Write lock with double-check
-	c.mu.Lock()
-	if entry, exists := c.items[path]; exists {
+	if !exists {
+		// Write lock with double-check
+		c.mu.Lock()
+		if entry, exists = c.items[path]; !exists {
+			entry = &cacheEntry{}
+			if old := c.order[c.next]; old != "" {
+				delete(c.items, old)
+			}
+			c.order[c.next] = path
+			c.next = (c.next + 1) % len(c.order)
+			c.items[path] = entry
+		}
 		c.mu.Unlock()
-		return entry.img
 	}
-	c.items[path] = &cacheEntry{img: img, loaded: true}
-	c.mu.Unlock()
 
-	return img
+	// Load from disk outside the map lock; later callers wait on once.
+	entry.once.Do(func() {
+		entry.img, _ = LoadTexture(path)
+		if entry.img != nil {
+			entry.avg = AverageColor(entry.img)
+		}
+	})
+	return entry
 }
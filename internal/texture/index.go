@@ -24,31 +24,40 @@ type Index struct {
 func BuildIndex(itemDir string, extraDirs ...string) *Index {
 	idx := &Index{entries: make(map[string]*texEntry)}
 
+	// Directories to walk. On case-insensitive filesystems "Texture" and
+	// "texture" are the same directory, so each candidate is checked with
+	// os.SameFile and only walked once.
+	var searchDirs []string
+	var seen []os.FileInfo
+	addDir := func(dir string) {
+		info, err := os.Stat(dir)
+		if err != nil || !info.IsDir() {
+			return
+		}
+		for _, s := range seen {
+			if os.SameFile(s, info) {
+				return
+			}
+		}
+		seen = append(seen, info)
+		searchDirs = append(searchDirs, dir)
+	}
+
 	// Scan main texture dir and all subdirectory texture dirs
-	searchDirs := []string{filepath.Join(itemDir, "texture")}
+	addDir(filepath.Join(itemDir, "texture"))
 
 	// Also scan subdirectory textures (e.g., Jewel/Texture, partCharge1/Texture)
 	entries, _ := os.ReadDir(itemDir)
 	for _, e := range entries {
 		if e.IsDir() {
-			subTex := filepath.Join(itemDir, e.Name(), "Texture")
-			if info, err := os.Stat(subTex); err == nil && info.IsDir() {
-				searchDirs = append(searchDirs, subTex)
-			}
-			subTexLower := filepath.Join(itemDir, e.Name(), "texture")
-			if subTexLower != subTex {
-				if info, err := os.Stat(subTexLower); err == nil && info.IsDir() {
-					searchDirs = append(searchDirs, subTexLower)
-				}
-			}
+			addDir(filepath.Join(itemDir, e.Name(), "Texture"))
+			addDir(filepath.Join(itemDir, e.Name(), "texture"))
 		}
 	}
 
 	// Add extra directories (e.g., Data/Skill)
 	for _, d := range extraDirs {
-		if info, err := os.Stat(d); err == nil && info.IsDir() {
-			searchDirs = append(searchDirs, d)
-		}
+		addDir(d)
 	}
 
 	for _, dir := range searchDirs {
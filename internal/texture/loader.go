@@ -4,6 +4,7 @@ import (
 	"bytes"
 	"fmt"
 	"image"
+	"image/color"
 	"image/draw"
 	"image/jpeg"
 	"os"
@@ -56,14 +57,41 @@ func toNRGBA(src image.Image) *image.NRGBA {
 		return n
 	}
 	b := src.Bounds()
-	dst := image.NewNRGBA(b)
-	draw.Draw(dst, b, src, b.Min, draw.Src)
-	// Ensure alpha=255 for opaque formats (JPEG/YCbCr/Gray)
 	switch src.(type) {
 	case *image.YCbCr, *image.Gray:
-		for i := 3; i < len(dst.Pix); i += 4 {
-			dst.Pix[i] = 255
-		}
+		// Opaque formats (JPEG/YCbCr/Gray): with alpha=255 everywhere,
+		// premultiplied and straight alpha are identical, so convert through
+		// image/draw's fast RGBA path and reuse the pixels as NRGBA.
+		rgba := image.NewRGBA(b)
+		draw.Draw(rgba, b, src, b.Min, draw.Src)
+		return &image.NRGBA{Pix: rgba.Pix, Stride: rgba.Stride, Rect: rgba.Rect}
 	}
+	dst := image.NewNRGBA(b)
+	draw.Draw(dst, b, src, b.Min, draw.Src)
 	return dst
 }
+
+// AverageColor returns the mean RGB of an image with alpha 255. An empty
+// image yields the renderer's neutral untextured gray.
+func AverageColor(tex *image.NRGBA) color.NRGBA {
+	b := tex.Bounds()
+	w, h := b.Dx(), b.Dy()
+	if w == 0 || h == 0 {
+		return color.NRGBA{160, 160, 170, 255}
+	}
+
+	var sumR, sumG, sumB float64
+	total := w * h
+	stride := tex.Stride
+	for y := 0; y < h; y++ {
+		off := y * stride
+		for x := 0; x < w; x++ {
+			i := off + x*4
+			sumR += float64(tex.Pix[i])
+			sumG += float64(tex.Pix[i+1])
+			sumB += float64(tex.Pix[i+2])
+		}
+	}
+	n := float64(total)
+	return color.NRGBA{uint8(sumR/n + 0.5), uint8(sumG/n + 0.5), uint8(sumB/n + 0.5), 255}
+}
@@ -16,38 +16,38 @@ import (
 
 // Load reads ItemTRSData.bmd and merges custom_trs.json overrides.
 func Load(bmdPath, customJSONPath, itemListXMLPath string) (Data, error) {
-	data := make(Data)
+	var data Data
 
 	// Binary TRS
 	if raw, err := os.ReadFile(bmdPath); err == nil && len(raw) >= 4 {
-		count := binary.LittleEndian.Uint32(raw[:4])
-		off := 4
-		for i := 0; i < int(count); i++ {
-			if off+32 > len(raw) {
-				break
-			}
-			dec := crypto.DecryptTRS(raw[off : off+32])
-			itemID := binary.LittleEndian.Uint32(dec[:4])
-			section := int(itemID / 512)
-			index := int(itemID % 512)
+		recs := parseBinaryRecords(raw)
+		// All binary entries share one backing array instead of one heap
+		// object per record; the map is sized for them up front.
+		entries := make([]Entry, len(recs))
+		data = make(Data, len(recs))
+		for i, rec := range recs {
+			section, index := splitItemID(rec.ItemID)
 
-			entry := &Entry{
-				PosX:         float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[4:8]))),
-				PosY:         float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[8:12]))),
-				PosZ:         float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[12:16]))),
-				RotX:         float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[16:20]))),
-				RotY:         float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[20:24]))),
-				RotZ:         float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[24:28]))),
-				Scale:        float64(math.Float32frombits(binary.LittleEndian.Uint32(dec[28:32]))),
+			entry := &entries[i]
+			*entry = Entry{
+				PosX:         float64(rec.Pos[0]),
+				PosY:         float64(rec.Pos[1]),
+				PosZ:         float64(rec.Pos[2]),
+				RotX:         float64(rec.Rot[0]),
+				RotY:         float64(rec.Rot[1]),
+				RotZ:         float64(rec.Rot[2]),
+				Scale:        float64(rec.Scale),
 				Source:       "binary",
 				DisplayAngle: DefaultDisplayAngle,
 				FillRatio:    DefaultFillRatio,
 				FOV:          DefaultFOV,
 			}
 			data[[2]int{section, index}] = entry
-			off += 32
 		}
 	}
+	if data == nil {
+		data = make(Data)
+	}
 
 	// Custom TRS overrides
 	mergeCustomTRS(data, customJSONPath, itemListXMLPath)
@@ -55,6 +55,76 @@ func Load(bmdPath, customJSONPath, itemListXMLPath string) (Data, error) {
 	return data, nil
 }
 
+// splitItemID splits a packed item ID (section*512 + index) into its
+// section and index. 512 is a power of two, so this is a shift and a mask.
+func splitItemID(id uint32) (section, index int) {
+	return int(id >> 9), int(id & 511)
+}
+
+// binaryRecordSize is the size of one record in ItemTRSData.bmd.
+const binaryRecordSize = 32
+
+// binaryRecord is one decoded ItemTRSData.bmd record:
+// item ID (u32), position (3×f32), rotation (3×f32), scale (f32).
+type binaryRecord struct {
+	ItemID uint32
+	Pos    [3]float32
+	Rot    [3]float32
+	Scale  float32
+}
+
+// recordMasks holds the TRS XOR key expanded over one record as 32-bit
+// little-endian words. The key restarts at every record, so word k of any
+// record is decrypted by XOR with recordMasks[k].
+var recordMasks = func() (m [binaryRecordSize / 4]uint32) {
+	for k := range m {
+		for j := 0; j < 4; j++ {
+			m[k] |= uint32(crypto.TRSXORKey[(4*k+j)%3]) << (8 * j)
+		}
+	}
+	return m
+}()
+
+// parseBinaryRecords decrypts and decodes every record of ItemTRSData.bmd in
+// one pass. raw is the whole file: a u32 record count followed by the records.
+// The count is clamped to the records actually present.
+func parseBinaryRecords(raw []byte) []binaryRecord {
+	count := int(binary.LittleEndian.Uint32(raw[:4]))
+	if avail := (len(raw) - 4) / binaryRecordSize; count > avail {
+		count = avail
+	}
+
+	recs := make([]binaryRecord, count)
+	for i := range recs {
+		off := 4 + i*binaryRecordSize
+		recs[i] = decodeBinaryRecord(raw[off : off+binaryRecordSize])
+	}
+	return recs
+}
+
+// decodeBinaryRecord decrypts and decodes one record straight from the
+// encrypted file bytes. Each field is a whole 32-bit word, so the XOR is
+// applied per word with recordMasks and no decrypted copy is made.
+func decodeBinaryRecord(b []byte) binaryRecord {
+	_ = b[binaryRecordSize-1]
+	m := &recordMasks
+	f32 := math.Float32frombits
+	return binaryRecord{
+		ItemID: binary.LittleEndian.Uint32(b[0:4]) ^ m[0],
+		Pos: [3]float32{
+			f32(binary.LittleEndian.Uint32(b[4:8]) ^ m[1]),
+			f32(binary.LittleEndian.Uint32(b[8:12]) ^ m[2]),
+			f32(binary.LittleEndian.Uint32(b[12:16]) ^ m[3]),
+		},
+		Rot: [3]float32{
+			f32(binary.LittleEndian.Uint32(b[16:20]) ^ m[4]),
+			f32(binary.LittleEndian.Uint32(b[20:24]) ^ m[5]),
+			f32(binary.LittleEndian.Uint32(b[24:28]) ^ m[6]),
+		},
+		Scale: f32(binary.LittleEndian.Uint32(b[28:32]) ^ m[7]),
+	}
+}
+
 // customTRSFile matches the JSON schema of custom_trs.json.
 type customTRSFile struct {
 	Resolution map[string]resolutionEntry `json:"resolution"`
@@ -340,10 +410,19 @@ func mergeCustomTRS(data Data, jsonPath, xmlPath string) {
 		return
 	}
 
-	// Parse itemlist once for sections and models lookups
-	var items []itemlist.ItemDef
+	// Parse itemlist once and index it by section and by lowercased model
+	// file, so each section or model entry touches only its own items.
+	var bySection map[int][]int
+	var byModel map[string][][2]int
 	if len(file.Sections) > 0 || len(file.Models) > 0 {
-		items, _ = itemlist.Parse(xmlPath)
+		items, _ := itemlist.Parse(xmlPath)
+		bySection = make(map[int][]int)
+		byModel = make(map[string][][2]int, len(items))
+		for _, item := range items {
+			bySection[item.Section] = append(bySection[item.Section], item.Index)
+			mf := strings.ToLower(item.ModelFile)
+			byModel[mf] = append(byModel[mf], [2]int{item.Section, item.Index})
+		}
 	}
 
 	// Section defaults/overrides
@@ -360,11 +439,8 @@ func mergeCustomTRS(data Data, jsonPath, xmlPath string) {
 		merge := c.Merge != nil && *c.Merge
 		entry := makeEntry(*c)
 
-		for _, item := range items {
-			if item.Section != sec {
-				continue
-			}
-			key := [2]int{sec, item.Index}
+		for _, idx := range bySection[sec] {
+			key := [2]int{sec, idx}
 			existing := data[key]
 
 			if existing == nil {
@@ -400,11 +476,9 @@ func mergeCustomTRS(data Data, jsonPath, xmlPath string) {
 			}
 			entry := makeEntry(c)
 			for _, mf := range modelFiles {
-				for _, item := range items {
-					if strings.EqualFold(item.ModelFile, mf) {
-						entryCopy := *entry
-						data[[2]int{item.Section, item.Index}] = &entryCopy
-					}
+				for _, key := range byModel[strings.ToLower(mf)] {
+					entryCopy := *entry
+					data[key] = &entryCopy
 				}
 			}
 			continue
@@ -416,11 +490,9 @@ func mergeCustomTRS(data Data, jsonPath, xmlPath string) {
 			continue
 		}
 		entry := makeEntry(*c)
-		for _, item := range items {
-			if strings.EqualFold(item.ModelFile, key) {
-				entryCopy := *entry
-				data[[2]int{item.Section, item.Index}] = &entryCopy
-			}
+		for _, k := range byModel[strings.ToLower(key)] {
+			entryCopy := *entry
+			data[k] = &entryCopy
 		}
 	}
 
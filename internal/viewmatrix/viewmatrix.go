@@ -33,7 +33,7 @@ func TRSViewMatrix(e *trs.Entry) mathutil.Mat3 {
 	rx := mathutil.Deg2Rad(e.RotX)
 	ry := mathutil.Deg2Rad(e.RotY)
 	rz := mathutil.Deg2Rad(e.RotZ)
-	trsRot := mathutil.Mat3Mul(mathutil.Mat3Mul(mathutil.RotZ(rz), mathutil.RotY(ry)), mathutil.RotX(rx))
+	trsRot := mathutil.EulerZYX(rx, ry, rz) // Rz @ Ry @ Rx
 
 	// Custom camera override
 	switch e.Camera {
@@ -69,7 +69,7 @@ func IsFallbackPath(e *trs.Entry) bool {
 // ComputeViewMatrix applies component filtering and returns the view matrix + filtered body meshes.
 // Effect mesh filtering is done earlier in the pipeline (before bone transforms).
 func ComputeViewMatrix(meshes []bmd.Mesh, entry *trs.Entry) (mathutil.Mat3, []bmd.Mesh) {
-	var bodyMeshes []bmd.Mesh
+	bodyMeshes := make([]bmd.Mesh, 0, len(meshes))
 	for i := range meshes {
 		// Skip FilterComponents for force-additive meshes — their duplicated
 		// geometry (e.g. energy beams) forms separate connected components that